@@ -172,8 +172,10 @@ def sortino_ratio(
     target_periodic = target_return / periods_per_year
 
     # Calculate Downside Deviation
-    # Sum of (min(0, r - target))^2
-    downside_sq_sum = sum(min(0.0, r - target_periodic) ** 2 for r in returns)
+    # Sum of (min(0, r - target))^2: only returns below target contribute
+    downside_sq_sum = sum(
+        (r - target_periodic) * (r - target_periodic) for r in returns if r < target_periodic
+    )
 
     # Sample Downside Deviation
     n = len(returns)
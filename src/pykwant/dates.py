@@ -6,19 +6,22 @@ This module handles date arithmetic, calendar management, and day count conventi
 following a functional programming paradigm.
 
 It provides:
-- Immutable `Calendar` data structures.
-- Pure functions for business day adjustments (Rolling Conventions).
-- Standard Day Count Conventions (ACT/365, 30/360, etc.).
+- Immutable `Calendar` data structures, backed by a bit-packed business day map.
+- Pure functions for business day adjustments (Rolling Conventions) and counting.
+- Standard Day Count Conventions (ACT/365, ACT/ACT, 30/360, BUS/252, etc.).
 - Schedule generation for financial instruments.
 
 All functions in this module are pure: they do not modify their inputs and
 always return new date objects or values.
 """
 
-from dataclasses import dataclass
-from datetime import date, timedelta
+from array import array
+from calendar import isleap, monthrange
+from dataclasses import dataclass, field
+from datetime import date
 from enum import IntEnum
-from typing import Callable, TypeAlias
+from functools import lru_cache
+from typing import Callable, Sequence, TypeAlias
 
 
 class Month(IntEnum):
@@ -50,7 +53,125 @@ class Weekday(IntEnum):
     SUNDAY = 7
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=64)
+def _build_bitmap(holidays: frozenset[date], weekends: tuple[int, ...]) -> tuple[int, bytes]:
+    """
+    Internal helper packing non-business days into a bitmap (1 bit per day).
+
+    The map covers whole years from the first to the last holiday year. Bit `o` is
+    set when the day with ordinal `epoch + o` is a weekend day or a holiday.
+    Outside the covered range only weekends apply, so an empty holiday set yields
+    an empty map. Results are cached, so equal calendars share a single bitmap;
+    the cache is bounded because calendars built on the fly (e.g. adding holidays
+    one at a time) would otherwise keep every intermediate bitmap alive.
+
+    Returns:
+        tuple[int, bytes]: The epoch ordinal (offset 0) and the little-endian bitmap.
+    """
+    if not holidays:
+        return 0, b""
+
+    epoch = date(min(holidays).year, 1, 1).toordinal()
+    end = date(max(holidays).year, 12, 31).toordinal() + 1
+    num_bytes = (end - epoch + 7) // 8
+    num_bits = num_bytes * 8
+
+    # Weekends repeat every 7 days: build the 7-bit pattern starting at the epoch
+    # weekday and replicate it with a repunit multiplication.
+    epoch_weekday = (epoch - 1) % 7 + 1
+    week = sum(1 << ((wd - epoch_weekday) % 7) for wd in set(weekends))
+    num_weeks = num_bits // 7 + 1
+    mask = (week * (((1 << (7 * num_weeks)) - 1) // 0x7F)) & ((1 << num_bits) - 1)
+
+    bitmap = bytearray(mask.to_bytes(num_bytes, "little"))
+    for h in holidays:
+        o = h.toordinal() - epoch
+        bitmap[o >> 3] |= 1 << (o & 7)
+
+    return epoch, bytes(bitmap)
+
+
+@lru_cache(maxsize=64)
+def _build_roll_tables(
+    holidays: frozenset[date], weekends: tuple[int, ...]
+) -> tuple[Sequence[int], Sequence[int]]:
+    """
+    Internal helper precomputing the next/previous business day over the bitmap range.
+
+    Entry `o` of each table holds the offset (from the bitmap epoch) of the first
+    business day on or after / on or before day `o`. Offsets may fall outside the
+    range when the nearest business day lies beyond it.
+
+    Tables are stored as contiguous int32 arrays (4 bytes per day) so calendars whose
+    holidays span centuries stay compact. Each entry still holds two int32 tables,
+    8 bytes per day in total, so the cache is bounded like the bitmap one; live
+    calendars keep their own references.
+
+    Returns:
+        tuple[Sequence[int], Sequence[int]]: The (next, previous) offset tables.
+    """
+    epoch, bitmap = _build_bitmap(holidays, weekends)
+    num_bits = len(bitmap) << 3
+    if num_bits == 0:
+        return array("i"), array("i")
+
+    weekend_set = set(weekends)
+
+    def is_weekend(o: int) -> bool:
+        return (epoch + o - 1) % 7 + 1 in weekend_set
+
+    # Seed each sweep with the nearest business day past the range edge, where only
+    # weekends apply (bounded so a calendar without working days cannot hang).
+    nxt = num_bits
+    for _ in range(7):
+        if not is_weekend(nxt):
+            break
+        nxt += 1
+    prv = -1
+    for _ in range(7):
+        if not is_weekend(prv):
+            break
+        prv -= 1
+
+    next_table = [0] * num_bits
+    for o in range(num_bits - 1, -1, -1):
+        if not (bitmap[o >> 3] >> (o & 7)) & 1:
+            nxt = o
+        next_table[o] = nxt
+
+    prev_table = [0] * num_bits
+    for o in range(num_bits):
+        if not (bitmap[o >> 3] >> (o & 7)) & 1:
+            prv = o
+        prev_table[o] = prv
+
+    return array("i", next_table), array("i", prev_table)
+
+
+@lru_cache(maxsize=None)
+def _weekend_shifts(weekends: tuple[int, ...]) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """
+    Internal helper giving, per ISO weekday (index 0 = Monday), the days to the
+    nearest non-weekend day forward and backward (0 for working weekdays).
+
+    Searches are bounded to one week, so a calendar without working days cannot hang.
+    """
+    weekend_set = set(weekends)
+    forward = []
+    backward = []
+    for wd in range(7):
+        k = 0
+        while k < 7 and (wd + k) % 7 + 1 in weekend_set:
+            k += 1
+        forward.append(k)
+        k = 0
+        while k < 7 and (wd - k) % 7 + 1 in weekend_set:
+            k += 1
+        backward.append(-k)
+    return tuple(forward), tuple(backward)
+
+
+@dataclass(frozen=True, slots=True)
 class Calendar:
     """
     Immutable representation of a financial calendar.
@@ -60,10 +181,34 @@ class Calendar:
                                     Using frozenset ensures O(1) lookup and immutability.
         weekends (tuple[int, ...]): A tuple of integers representing weekend days
                                     (e.g., (6, 7) for Sat/Sun). Defaults to Sat/Sun.
+
+    On construction the holidays and weekends are packed into a bitmap (one bit per
+    day), so business day checks are a bit test and range counts are a popcount.
+    Next/previous business day tables make rolling conventions a single lookup.
     """
 
     holidays: frozenset[date] = frozenset()
     weekends: tuple[int, ...] = (Weekday.SATURDAY, Weekday.SUNDAY)
+    _epoch_ordinal: int = field(init=False, repr=False, compare=False)
+    _bitmap: bytes = field(init=False, repr=False, compare=False)
+    _next_business_day: Sequence[int] = field(init=False, repr=False, compare=False)
+    _prev_business_day: Sequence[int] = field(init=False, repr=False, compare=False)
+    _next_weekday_shift: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _prev_weekday_shift: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Normalize to hashable containers so the bitmap build can be cached
+        object.__setattr__(self, "holidays", frozenset(self.holidays))
+        object.__setattr__(self, "weekends", tuple(self.weekends))
+        epoch, bitmap = _build_bitmap(self.holidays, self.weekends)
+        object.__setattr__(self, "_epoch_ordinal", epoch)
+        object.__setattr__(self, "_bitmap", bitmap)
+        next_table, prev_table = _build_roll_tables(self.holidays, self.weekends)
+        object.__setattr__(self, "_next_business_day", next_table)
+        object.__setattr__(self, "_prev_business_day", prev_table)
+        next_shift, prev_shift = _weekend_shifts(self.weekends)
+        object.__setattr__(self, "_next_weekday_shift", next_shift)
+        object.__setattr__(self, "_prev_weekday_shift", prev_shift)
 
 
 def is_business_day(d: date, cal: Calendar) -> bool:
@@ -77,11 +222,69 @@ def is_business_day(d: date, cal: Calendar) -> bool:
     Returns:
         bool: True if the date is not a weekend and not a holiday, False otherwise.
     """
-    if d.isoweekday() in cal.weekends:
-        return False
-    if d in cal.holidays:
-        return False
-    return True
+    bitmap = cal._bitmap
+    if bitmap:
+        o = d.toordinal() - cal._epoch_ordinal
+        if 0 <= o < len(bitmap) << 3:
+            return not (bitmap[o >> 3] >> (o & 7)) & 1
+    # Holiday-free calendar, or outside the bitmap range: only weekends apply
+    return d.isoweekday() not in cal.weekends
+
+
+def _count_weekend_days(start_ordinal: int, end_ordinal: int, weekends: tuple[int, ...]) -> int:
+    """Internal helper counting weekend days with ordinals in [start_ordinal, end_ordinal)."""
+    num_days = end_ordinal - start_ordinal
+    full_weeks, remainder = divmod(num_days, 7)
+    weekend_set = set(weekends)
+    count = full_weeks * len(weekend_set)
+    first_weekday = (start_ordinal + full_weeks * 7 - 1) % 7 + 1
+    for k in range(remainder):
+        if (first_weekday + k - 1) % 7 + 1 in weekend_set:
+            count += 1
+    return count
+
+
+def business_days_between(start: date, end: date, cal: Calendar) -> int:
+    """
+    Counts the business days in the half-open interval [start, end).
+
+    The part of the interval covered by the calendar bitmap is counted with a single
+    popcount; the remainder only needs weekend arithmetic.
+
+    Args:
+        start (date): The first date (inclusive).
+        end (date): The last date (exclusive).
+        cal (Calendar): The calendar.
+
+    Returns:
+        int: The number of business days. Negative if `end` is before `start`.
+    """
+    if end < start:
+        return -business_days_between(end, start, cal)
+
+    o0 = start.toordinal()
+    o1 = end.toordinal()
+    epoch = cal._epoch_ordinal
+    bitmap = cal._bitmap
+
+    # Holiday-free calendar: closed-form weekend count only
+    if not bitmap:
+        return (o1 - o0) - _count_weekend_days(o0, o1, cal.weekends)
+
+    # Clip the interval to the bitmap range [epoch, epoch + num_bits)
+    lo = min(max(o0, epoch), o1)
+    hi = max(min(o1, epoch + (len(bitmap) << 3)), lo)
+
+    non_business = _count_weekend_days(o0, lo, cal.weekends)
+    non_business += _count_weekend_days(hi, o1, cal.weekends)
+
+    if hi > lo:
+        a = lo - epoch
+        b = hi - epoch
+        chunk = int.from_bytes(bitmap[a >> 3 : (b + 7) >> 3], "little") >> (a & 7)
+        non_business += (chunk & ((1 << (b - a)) - 1)).bit_count()
+
+    return (o1 - o0) - non_business
 
 
 def _adjust(d: date, cal: Calendar, step: int = 1) -> date:
@@ -96,10 +299,20 @@ def _adjust(d: date, cal: Calendar, step: int = 1) -> date:
     Returns:
         date: The first valid business day found.
     """
-    current = d
-    while not is_business_day(current, cal):
-        current += timedelta(days=step)
-    return current
+    epoch = cal._epoch_ordinal
+    if step > 0:
+        table, shifts = cal._next_business_day, cal._next_weekday_shift
+    else:
+        table, shifts = cal._prev_business_day, cal._prev_weekday_shift
+
+    o = d.toordinal() - epoch
+    if not 0 <= o < len(table):
+        # Outside the tables (or holiday-free calendar) only weekends apply:
+        # skip them in one jump, then resolve via the table if we landed inside it
+        o += shifts[d.weekday()]
+        if not 0 <= o < len(table):
+            return date.fromordinal(epoch + o)
+    return date.fromordinal(epoch + table[o])
 
 
 def following(d: date, cal: Calendar) -> date:
@@ -178,7 +391,7 @@ def act_365(start: date, end: date) -> float:
     Returns:
         float: The year fraction (e.g., 0.25 for ~3 months).
     """
-    return (end - start).days / 365.0
+    return (end.toordinal() - start.toordinal()) / 365.0
 
 
 def act_360(start: date, end: date) -> float:
@@ -195,9 +408,10 @@ def act_360(start: date, end: date) -> float:
     Returns:
         float: The year fraction.
     """
-    return (end - start).days / 360.0
+    return (end.toordinal() - start.toordinal()) / 360.0
 
 
+@lru_cache(maxsize=4096)
 def thirty_360(start: date, end: date) -> float:
     """
     30/360 (Bond Basis) day count convention.
@@ -205,6 +419,9 @@ def thirty_360(start: date, end: date) -> float:
     Assumes every month has 30 days. Useful for standard corporate bonds.
     Implements the standard ISDA logic (30U/360).
 
+    Results are memoized per date pair: coupon periods of bonds sharing a
+    schedule repeat the same pairs, and a cache hit is cheaper than the rules.
+
     Args:
         start (date): The start date.
         end (date): The end date.
@@ -212,22 +429,64 @@ def thirty_360(start: date, end: date) -> float:
     Returns:
         float: The year fraction.
     """
-    d1 = start.day
+    # 30U/360 day rules: D1 = 31 -> 30; D2 = 31 -> 30 only if D1 is (now) 30
+    d1 = min(start.day, 30)
     d2 = end.day
-    m1 = start.month
-    m2 = end.month
-    y1 = start.year
-    y2 = end.year
-
-    if d1 == 31:
-        d1 = 30
     if d2 == 31 and d1 == 30:
         d2 = 30
 
-    days = 360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)
+    days = 360 * (end.year - start.year) + 30 * (end.month - start.month) + (d2 - d1)
     return days / 360.0
 
 
+def act_act_isda(start: date, end: date) -> float:
+    """
+    ACT/ACT (ISDA) day count convention.
+
+    Days falling in leap years are divided by 366, all other days by 365.
+    Whole calendar years in between contribute exactly 1.0 each.
+
+    Args:
+        start (date): The start date.
+        end (date): The end date.
+
+    Returns:
+        float: The year fraction.
+    """
+    if end < start:
+        return -act_act_isda(end, start)
+
+    y1 = start.year
+    y2 = end.year
+    basis1 = 366.0 if isleap(y1) else 365.0
+
+    if y1 == y2:
+        return (end.toordinal() - start.toordinal()) / basis1
+
+    basis2 = 366.0 if isleap(y2) else 365.0
+    days_in_first = date(y1 + 1, 1, 1).toordinal() - start.toordinal()
+    days_in_last = end.toordinal() - date(y2, 1, 1).toordinal()
+    return days_in_first / basis1 + (y2 - y1 - 1) + days_in_last / basis2
+
+
+def business_252(start: date, end: date, cal: Calendar) -> float:
+    """
+    BUS/252 day count convention (e.g., Brazilian markets).
+
+    Counts the business days in [start, end) on the given calendar and divides by 252.
+    Use `functools.partial(business_252, cal=...)` where a `DayCountConvention` is expected.
+
+    Args:
+        start (date): The start date.
+        end (date): The end date.
+        cal (Calendar): The business day calendar.
+
+    Returns:
+        float: The year fraction.
+    """
+    return business_days_between(start, end, cal) / 252.0
+
+
 # Type alias for Day Count functions
 DayCountConvention: TypeAlias = Callable[[date, date], float]
 
@@ -246,8 +505,8 @@ def generate_schedule(
     Generates a list of adjusted payment dates.
 
     This function creates a sequence of theoretical unadjusted dates by adding
-    months to the start date, and then adjusts each one according to the
-    provided rolling convention and calendar.
+    multiples of `freq_month` months to the start date (clipped to month-end),
+    and then adjusts each one according to the provided rolling convention and calendar.
 
     Args:
         start (date): The start date of the schedule (e.g., Issue Date).
@@ -260,34 +519,29 @@ def generate_schedule(
         list[date]: A sorted list of valid business days representing the schedule.
                     Does not include the start date, includes the end date.
     """
-    dates_list = []
-    current = start
-
-    # We generate dates until we reach or exceed the end date
-    # Note: A robust implementation would handle month-end adjustments (e.g. 28th Feb -> 30th)
-    # more explicitly. Here we rely on simple month addition logic.
-    while True:
-        # Simple month addition logic
-        y = current.year + (current.month + freq_month - 1) // 12
-        m = (current.month + freq_month - 1) % 12 + 1
-
-        # Handle invalid days (e.g. Feb 30)
-        # In a real library, this logic might be more sophisticated (e.g. moving to last day)
-        try:
-            current = date(y, m, start.day)
-        except ValueError:
-            # Fallback to last day of month if start.day doesn't exist (e.g. 31st -> 30th/28th)
-            # This is a simplification; robust date math is complex.
-            if m == 2:
-                current = date(y, m, 28)  # Leap year check omitted for brevity in this snippet
-            else:
-                current = date(y, m, 30)
-
-        if current > end:
-            break
-
-        adjusted_date = convention(current, cal)
-        dates_list.append(adjusted_date)
+    # Period k ends k * freq_month months after the start, computed directly from a
+    # month index rather than by repeated addition. Days that do not exist in the
+    # target month (e.g. 31st -> April, 30th -> February) are clipped to month-end.
+    base = start.year * 12 + start.month - 1
+    num_periods = (end.year * 12 + end.month - 1 - base) // freq_month
+    day = start.day
+
+    # Month indices (year * 12 + month - 1) of every period end, sized up front
+    month_indices = range(base + freq_month, base + num_periods * freq_month + 1, freq_month)
+    if day <= 28:
+        # Every month has the day: no clipping needed
+        unadjusted = [date(mi // 12, mi % 12 + 1, day) for mi in month_indices]
+    else:
+        unadjusted = [
+            date(mi // 12, mi % 12 + 1, min(day, monthrange(mi // 12, mi % 12 + 1)[1]))
+            for mi in month_indices
+        ]
+
+    # Only the last period can overshoot the end (same month, later day)
+    if unadjusted and unadjusted[-1] > end:
+        unadjusted.pop()
+
+    dates_list = [convention(d, cal) for d in unadjusted]
 
     # Ensure the maturity date is included and adjusted properly
     # Often the last generated date IS the maturity, but sometimes there's a stub.
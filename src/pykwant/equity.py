@@ -8,14 +8,42 @@ focusing on the Black-Scholes-Merton framework.
 It adheres to the library's functional paradigm:
 - Inputs: Immutable data structures (EuropeanOption) and market data (Spot, Vol, Curve).
 - Output: The calculated price (Money).
+
+The closed-form math lives in a scalar kernel operating on already-resolved inputs,
+so pricing many spots for the same option (`black_scholes_prices`) only resolves
+the time to maturity and the curve once.
 """
 
 import math
 from datetime import date
+from typing import List, Sequence
 
 from pykwant import dates, instruments, math_utils, rates
 
 
+def _bs_core(S: float, K: float, T: float, r: float, df: float, sigma: float, sign: float) -> float:
+    """
+    Internal scalar Black-Scholes kernel on resolved inputs.
+
+    Expects T > 0, the discount factor df = e^(-rT) already extracted from the curve,
+    and sign = +1 for a call or -1 for a put, so both share one formula:
+    sign * (S * N(sign * d1) - K * df * N(sign * d2)).
+    """
+    # Edge Case: Zero Volatility -> discounted forward intrinsic, max(sign * (S - K*e^-rT), 0)
+    if sigma <= 0:
+        return max(sign * (S - K * df), 0.0)
+
+    # d1, d2 Calculation
+    vol_sqrt_T = sigma * math.sqrt(T)
+    d1 = (math.log(S / K) + (r + 0.5 * sigma**2) * T) / vol_sqrt_T
+    d2 = d1 - vol_sqrt_T
+
+    # Pricing (using standard normal CDF)
+    norm_cdf = math_utils.norm_cdf
+    price = sign * (S * norm_cdf(sign * d1) - K * df * norm_cdf(sign * d2))
+    return max(price, 0.0)
+
+
 def black_scholes_price(
     option: instruments.EuropeanOption,
     spot: float,
@@ -65,34 +93,52 @@ def black_scholes_price(
     # DF = e^(-rT)  =>  r = -ln(DF) / T
     df = curve(option.expiry_date)
 
+    # Resolve call/put once: +1 for calls, -1 for puts
+    sign = 1.0 if option.call_put == "call" else -1.0
+
     # Handle extremely short time to avoid division by zero
     if T <= 1e-9:
-        intrinsic = max(S - K, 0.0) if option.call_put == "call" else max(K - S, 0.0)
-        return instruments.Money(intrinsic)
+        return instruments.Money(max(sign * (S - K), 0.0))
 
     r = -math.log(df) / T
 
-    # 3. Handle Edge Case: Zero Volatility
-    if sigma == 0:
-        # If vol is zero, the option value is the intrinsic value discounted
-        # (max(S - K*e^-rT, 0))
-        forward_price = S * math.exp(r * T)
-        if option.call_put == "call":
-            payoff = max(forward_price - K, 0.0)
-        else:
-            payoff = max(K - forward_price, 0.0)
-        return instruments.Money(payoff * df)
-
-    # 4. d1, d2 Calculation
-    d1 = (math.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
-    d2 = d1 - sigma * math.sqrt(T)
-
-    # 5. Pricing (using standard normal CDF)
-    if option.call_put == "call":
-        price = S * math_utils.norm_cdf(d1) - K * df * math_utils.norm_cdf(d2)
-    else:
-        # Put-Call Parity: P = C - S + K * df
-        # Or direct formula:
-        price = K * df * math_utils.norm_cdf(-d2) - S * math_utils.norm_cdf(-d1)
-
-    return instruments.Money(max(price, 0.0))
+    # 3. Closed-form valuation
+    return instruments.Money(_bs_core(S, K, T, r, df, sigma, sign))
+
+
+def black_scholes_prices(
+    option: instruments.EuropeanOption,
+    spots: Sequence[float],
+    volatility: float,
+    curve: rates.YieldCurveFn,
+    valuation_date: date,
+) -> List[instruments.Money]:
+    """
+    Prices a European Option for a batch of spot prices (e.g., a scenario grid).
+
+    Equivalent to calling `black_scholes_price` once per spot, but the time to
+    maturity, discount factor and implied rate are resolved only once.
+
+    Args:
+        option (instruments.EuropeanOption): The option instrument definition.
+        spots (Sequence[float]): The spot prices of the underlying asset.
+        volatility (float): The annualized volatility in decimal format.
+        curve (rates.YieldCurveFn): The risk-free yield curve function.
+        valuation_date (date): The date on which valuation is performed.
+
+    Returns:
+        List[instruments.Money]: One price per spot, in the same order.
+    """
+    if valuation_date > option.expiry_date:
+        return [instruments.Money(0.0) for _ in spots]
+
+    T = dates.act_365(valuation_date, option.expiry_date)
+    K = float(option.strike)
+    sign = 1.0 if option.call_put == "call" else -1.0
+    df = curve(option.expiry_date)
+
+    if T <= 1e-9:
+        return [instruments.Money(max(sign * (S - K), 0.0)) for S in spots]
+
+    r = -math.log(df) / T
+    return [instruments.Money(_bs_core(S, K, T, r, df, volatility, sign)) for S in spots]
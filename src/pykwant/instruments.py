@@ -10,11 +10,16 @@ It strictly follows the Functional Programming paradigm by separating:
 Key Concepts:
 - **Money**: A semantic alias for float to indicate monetary values.
 - **CashFlow**: The atomic unit of valuation.
+- **CashFlowSchedule**: Column-oriented (struct-of-arrays) storage of a flow sequence.
 """
 
+import math
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import date
-from typing import List, NewType, Union
+from functools import lru_cache
+from typing import Iterator, List, NewType, Sequence, Union
 
 from pykwant import dates, rates
 
@@ -23,7 +28,7 @@ from pykwant import dates, rates
 Money = NewType("Money", float)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CashFlow:
     """
     Represents a single atomic cash flow.
@@ -39,7 +44,36 @@ class CashFlow:
     type: str = "coupon"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class CashFlowSchedule:
+    """
+    Column-oriented representation of a sequence of cash flows.
+
+    Each attribute holds one column, aligned by index. Pricing loops read the
+    dates and amounts directly instead of going through per-flow objects;
+    iterating yields `CashFlow` records for row-oriented consumers.
+
+    Attributes:
+        payment_dates (tuple[date, ...]): Payment dates, in ascending order.
+        amounts (tuple[Money, ...]): The monetary values of the flows.
+        types (tuple[str, ...]): The nature of each flow (e.g., 'coupon', 'principal').
+    """
+
+    payment_dates: tuple[date, ...]
+    amounts: tuple[Money, ...]
+    types: tuple[str, ...]
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def __iter__(self) -> Iterator[CashFlow]:
+        for amount, payment_date, flow_type in zip(
+            self.amounts, self.payment_dates, self.types, strict=True
+        ):
+            yield CashFlow(amount, payment_date, flow_type)
+
+
+@dataclass(frozen=True, slots=True)
 class FixedRateBond:
     """
     Immutable representation of a Fixed Rate Bond.
@@ -63,7 +97,7 @@ class FixedRateBond:
     calendar: dates.Calendar
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EuropeanOption:
     """
     Immutable representation of a Vanilla European Option.
@@ -76,7 +110,7 @@ class EuropeanOption:
     call_put: str = "call"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AmericanOption:
     """
     Immutable representation of a Vanilla American Option.
@@ -99,13 +133,21 @@ class AmericanOption:
 Instrument = Union[FixedRateBond, EuropeanOption, AmericanOption]
 
 
-def generate_cash_flows(bond: FixedRateBond) -> List[CashFlow]:
-    """
-    Generates the deterministic schedule of cash flows for a Fixed Rate Bond.
+@lru_cache(maxsize=1024)
+def cash_flow_schedule(bond: FixedRateBond) -> CashFlowSchedule:
     """
-    flows = []
+    Generates the deterministic cash flows of a Fixed Rate Bond as columns.
 
-    # Generate unadjusted schedule dates
+    Bonds are immutable and hashable, so the schedule is cached per bond: repeated
+    revaluations (pricing, accrued interest, clean price) share a single instance.
+
+    Args:
+        bond (FixedRateBond): The bond.
+
+    Returns:
+        CashFlowSchedule: The coupons followed by the principal repayment at maturity.
+    """
+    # Generate adjusted schedule dates
     schedule = dates.generate_schedule(
         start=bond.start_date,
         end=bond.maturity_date,
@@ -114,41 +156,66 @@ def generate_cash_flows(bond: FixedRateBond) -> List[CashFlow]:
         convention=dates.modified_following,
     )
 
-    current_start = bond.start_date
-
-    # Calculate Coupons
-    for pay_date in schedule:
-        tau = bond.day_count(current_start, pay_date)
-        amount = Money(bond.face_value * bond.coupon_rate * tau)
-        flows.append(CashFlow(amount, pay_date, "coupon"))
-        current_start = pay_date
+    # Calculate Coupons over consecutive accrual periods
+    notional_rate = bond.face_value * bond.coupon_rate
+    day_count = bond.day_count
+    amounts = [
+        Money(notional_rate * day_count(period_start, period_end))
+        for period_start, period_end in zip([bond.start_date, *schedule], schedule, strict=False)
+    ]
 
     # Add Principal Repayment at maturity
     last_date = schedule[-1] if schedule else bond.maturity_date
-    flows.append(CashFlow(bond.face_value, last_date, "principal"))
+    amounts.append(bond.face_value)
 
-    return flows
+    return CashFlowSchedule(
+        payment_dates=(*schedule, last_date),
+        amounts=tuple(amounts),
+        types=("coupon",) * len(schedule) + ("principal",),
+    )
 
 
-def accrued_interest(bond: FixedRateBond, valuation_date: date) -> float:
+def generate_cash_flows(bond: FixedRateBond) -> List[CashFlow]:
     """
-    Calculates the Accrued Interest for a bond at a given valuation date.
+    Generates the deterministic schedule of cash flows for a Fixed Rate Bond.
+    """
+    return list(cash_flow_schedule(bond))
+
+
+if sys.version_info >= (3, 12):
+    # Dot product in a single C loop (with extended-precision accumulation)
+    _sumprod = math.sumprod
+else:
+
+    def _sumprod(xs: Sequence[float], ys: Sequence[float]) -> float:
+        """Internal fallback for `math.sumprod` on Python < 3.12."""
+        total = 0.0
+        for x, y in zip(xs, ys, strict=True):
+            total += x * y
+        return total
+
+
+def _bond_npv(flows: CashFlowSchedule, first: int, curve: rates.YieldCurveFn) -> float:
+    """Internal helper discounting the flows from index `first` (the unpaid ones)."""
+    dfs = rates.discount_factors(curve, flows.payment_dates[first:])
+    return _sumprod(flows.amounts[first:], dfs)
+
+
+def _bond_accrued(
+    bond: FixedRateBond, flows: CashFlowSchedule, first: int, valuation_date: date
+) -> float:
+    """
+    Internal helper computing accrued interest from the bisected flow index.
+
+    `first` is the number of flows paid on or before the valuation date. Coupon dates
+    are all flows but the final principal, so the current period starts at the last
+    coupon among them (or at issue).
     """
     if valuation_date < bond.start_date:
         return 0.0
 
-    schedule = dates.generate_schedule(
-        start=bond.start_date,
-        end=bond.maturity_date,
-        freq_month=bond.frequency_months,
-        cal=bond.calendar,
-    )
-
-    prev_date = bond.start_date
-    for d in schedule:
-        if d > valuation_date:
-            break
-        prev_date = d
+    i = min(first, len(flows.payment_dates) - 1)
+    prev_date = flows.payment_dates[i - 1] if i > 0 else bond.start_date
 
     if prev_date == valuation_date:
         return 0.0
@@ -157,6 +224,15 @@ def accrued_interest(bond: FixedRateBond, valuation_date: date) -> float:
     return bond.face_value * bond.coupon_rate * tau
 
 
+def accrued_interest(bond: FixedRateBond, valuation_date: date) -> float:
+    """
+    Calculates the Accrued Interest for a bond at a given valuation date.
+    """
+    flows = cash_flow_schedule(bond)
+    first = bisect_right(flows.payment_dates, valuation_date)
+    return _bond_accrued(bond, flows, first, valuation_date)
+
+
 def price_instrument(
     instrument: Instrument, curve: rates.YieldCurveFn, valuation_date: date
 ) -> float:
@@ -166,12 +242,11 @@ def price_instrument(
     or raises error if external modules must be used directly.
     """
     if isinstance(instrument, FixedRateBond):
-        flows = generate_cash_flows(instrument)
-        npv = 0.0
-        for cf in flows:
-            if cf.payment_date > valuation_date:
-                npv += rates.present_value(cf.amount, cf.payment_date, curve)
-        return npv
+        flows = cash_flow_schedule(instrument)
+
+        # Flows are sorted by date: skip those paid on or before the valuation date
+        first = bisect_right(flows.payment_dates, valuation_date)
+        return _bond_npv(flows, first, curve)
 
     if isinstance(instrument, (EuropeanOption, AmericanOption)):
         raise NotImplementedError(
@@ -184,7 +259,12 @@ def price_instrument(
 def clean_price(bond: FixedRateBond, curve: rates.YieldCurveFn, valuation_date: date) -> float:
     """
     Calculates the Clean Price of a bond.
+
+    Dirty price and accrued interest share one schedule lookup and one bisection.
     """
-    dirty = price_instrument(bond, curve, valuation_date)
-    accrued = accrued_interest(bond, valuation_date)
+    flows = cash_flow_schedule(bond)
+    first = bisect_right(flows.payment_dates, valuation_date)
+
+    dirty = _bond_npv(flows, first, curve)
+    accrued = _bond_accrued(bond, flows, first, valuation_date)
     return dirty - accrued
@@ -10,12 +10,35 @@ It supports both:
 2. **Historical Approach**: Uses historical simulation data.
 
 All calculations are performed using pure Python and the `math_utils` module.
+For repeated evaluation at fixed parameters, `parametric_var_fn` and
+`parametric_expected_shortfall_fn` return specialized closures.
 """
 
 import math
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Callable, Sequence, TypeAlias
 
 from pykwant import math_utils
 
+# A risk measure specialized on its parameters: f(portfolio_value, volatility) -> loss
+ParametricRiskFn: TypeAlias = Callable[[float, float], float]
+
+
+@lru_cache(maxsize=64)
+def _tail_z_score(confidence_level: float) -> tuple[float, float]:
+    r"""
+    Internal helper returning the tail z-score and its density for a confidence level.
+
+    Confidence levels are almost always a handful of standard values (0.95, 0.975,
+    0.99), so the inverse CDF is evaluated once per level and cached.
+
+    Returns:
+        tuple[float, float]: $z_{\alpha}$ = norm_ppf(1 - c) (negative) and $\phi(z_{\alpha})$.
+    """
+    z_alpha = math_utils.norm_ppf(1.0 - confidence_level)
+    return z_alpha, math_utils.norm_pdf(z_alpha)
+
 
 def parametric_var(
     portfolio_value: float,
@@ -47,13 +70,10 @@ def parametric_var(
     if not (0 < confidence_level < 1):
         raise ValueError("Confidence level must be between 0 and 1.")
 
-    # Calculate alpha (tail probability)
-    # For 95% confidence, we look at the bottom 5% tail.
-    alpha = 1.0 - confidence_level
-
-    # Get the z-score (number of std devs) for the tail
-    # norm_ppf(0.05) ~ -1.645. We want the absolute distance.
-    z_score = abs(math_utils.norm_ppf(alpha))
+    # Get the z-score (number of std devs) for the tail (alpha = 1 - confidence)
+    # For 95% confidence, norm_ppf(0.05) ~ -1.645. We want the absolute distance.
+    z_alpha, _ = _tail_z_score(confidence_level)
+    z_score = abs(z_alpha)
 
     # Scale volatility to the horizon
     # sigma_daily = sigma_annual / sqrt(252)
@@ -64,7 +84,10 @@ def parametric_var(
 
 
 def historical_var(
-    portfolio_value: float, returns: list[float], confidence_level: float = 0.95
+    portfolio_value: float,
+    returns: Sequence[float],
+    confidence_level: float = 0.95,
+    sorted_returns: bool = False,
 ) -> float:
     r"""
     Calculates the Historical Value at Risk (VaR) using historical simulation.
@@ -74,8 +97,12 @@ def historical_var(
 
     Args:
         portfolio_value (float): Current market value of the portfolio.
-        returns (list[float]): List of historical period returns (e.g., daily).
+        returns (Sequence[float]): Historical period returns (e.g., daily), as a list,
+            tuple or `array('d')`.
         confidence_level (float, optional): Confidence level (e.g., 0.95). Defaults to 0.95.
+        sorted_returns (bool, optional): Optimization flag. If True, assumes `returns` is
+            already sorted ascending, so a series sorted once can be reused across
+            VaR and ES calls. Defaults to False.
 
     Returns:
         float: The estimated maximum loss (positive number).
@@ -87,7 +114,7 @@ def historical_var(
 
     # Calculate the percentile of returns (e.g., 5th percentile for 95% confidence)
     # We expect returns to be mostly negative in the tail.
-    worst_return = math_utils.percentile(returns, alpha)
+    worst_return = math_utils.percentile(returns, alpha, sorted_data=sorted_returns)
 
     # VaR is the loss amount. If return is -0.05, VaR is 0.05 * Value.
     # We return a positive number representing the loss.
@@ -122,10 +149,9 @@ def parametric_expected_shortfall(
         raise ValueError("Confidence level must be between 0 and 1.")
 
     alpha = 1.0 - confidence_level
-    z_score = math_utils.norm_ppf(alpha)  # Negative value e.g. -1.645
 
-    # PDF at the z-score
-    pdf_z = math_utils.norm_pdf(z_score)
+    # z-score (negative value e.g. -1.645) and the PDF at the z-score
+    _, pdf_z = _tail_z_score(confidence_level)
 
     # Volatility over horizon
     sigma_horizon = volatility * math.sqrt(horizon_days / periods_per_year)
@@ -137,7 +163,10 @@ def parametric_expected_shortfall(
 
 
 def historical_expected_shortfall(
-    portfolio_value: float, returns: list[float], confidence_level: float = 0.95
+    portfolio_value: float,
+    returns: Sequence[float],
+    confidence_level: float = 0.95,
+    sorted_returns: bool = False,
 ) -> float:
     r"""
     Calculates the Historical Expected Shortfall (CVaR).
@@ -147,8 +176,10 @@ def historical_expected_shortfall(
 
     Args:
         portfolio_value (float): Current market value.
-        returns (list[float]): List of historical returns.
+        returns (Sequence[float]): Historical returns (list, tuple or `array('d')`).
         confidence_level (float, optional): Confidence level. Defaults to 0.95.
+        sorted_returns (bool, optional): Optimization flag. If True, assumes `returns` is
+            already sorted ascending and reads the tail as a prefix. Defaults to False.
 
     Returns:
         float: The expected shortfall amount.
@@ -157,10 +188,13 @@ def historical_expected_shortfall(
         raise ValueError("Returns list cannot be empty.")
 
     alpha = 1.0 - confidence_level
-    cutoff = math_utils.percentile(returns, alpha)
+    cutoff = math_utils.percentile(returns, alpha, sorted_data=sorted_returns)
 
-    # Filter returns worse than cutoff (tail)
-    tail_returns = [r for r in returns if r <= cutoff]
+    # Filter returns worse than cutoff (tail); for sorted input the tail is a prefix
+    if sorted_returns:
+        tail_returns = returns[: bisect_right(returns, cutoff)]
+    else:
+        tail_returns = [r for r in returns if r <= cutoff]
 
     if not tail_returns:
         # Should not happen given percentile logic unless list is very short or uniform
@@ -169,3 +203,72 @@ def historical_expected_shortfall(
     avg_tail_return = math_utils.mean(tail_returns)
 
     return portfolio_value * abs(avg_tail_return)
+
+
+def parametric_var_fn(
+    confidence_level: float = 0.95,
+    horizon_days: int = 1,
+    periods_per_year: int = 252,
+) -> ParametricRiskFn:
+    """
+    Creates a Parametric VaR function specialized on its risk parameters.
+
+    The z-score and horizon scaling are resolved once, so the returned closure
+    only multiplies. It matches `parametric_var` for the same parameters.
+
+    Args:
+        confidence_level (float, optional): Confidence level (e.g., 0.95 or 0.99). Defaults to 0.95.
+        horizon_days (int, optional): Time horizon in days. Defaults to 1.
+        periods_per_year (int, optional): Trading days in a year. Defaults to 252.
+
+    Returns:
+        ParametricRiskFn: A callable `f(portfolio_value, volatility) -> VaR`.
+
+    Raises:
+        ValueError: If the confidence level is not in (0, 1).
+    """
+    if not (0 < confidence_level < 1):
+        raise ValueError("Confidence level must be between 0 and 1.")
+
+    z_alpha, _ = _tail_z_score(confidence_level)
+    z_score = abs(z_alpha)
+    horizon_scale = math.sqrt(horizon_days / periods_per_year)
+
+    def _var(portfolio_value: float, volatility: float) -> float:
+        return portfolio_value * (volatility * horizon_scale) * z_score
+
+    return _var
+
+
+def parametric_expected_shortfall_fn(
+    confidence_level: float = 0.95,
+    horizon_days: int = 1,
+    periods_per_year: int = 252,
+) -> ParametricRiskFn:
+    """
+    Creates a Parametric Expected Shortfall function specialized on its risk parameters.
+
+    It matches `parametric_expected_shortfall` for the same parameters.
+
+    Args:
+        confidence_level (float, optional): Confidence level (e.g., 0.95). Defaults to 0.95.
+        horizon_days (int, optional): Horizon in days. Defaults to 1.
+        periods_per_year (int, optional): Periods per year. Defaults to 252.
+
+    Returns:
+        ParametricRiskFn: A callable `f(portfolio_value, volatility) -> ES`.
+
+    Raises:
+        ValueError: If the confidence level is not in (0, 1).
+    """
+    if not (0 < confidence_level < 1):
+        raise ValueError("Confidence level must be between 0 and 1.")
+
+    _, pdf_z = _tail_z_score(confidence_level)
+    es_factor = pdf_z / (1.0 - confidence_level)
+    horizon_scale = math.sqrt(horizon_days / periods_per_year)
+
+    def _es(portfolio_value: float, volatility: float) -> float:
+        return portfolio_value * (volatility * horizon_scale) * es_factor
+
+    return _es
@@ -11,11 +11,25 @@ It includes:
 3.  **Relationships**: Covariance, Correlation.
 4.  **Quantiles**: Linear interpolation for percentiles (useful for VaR).
 
-The Inverse CDF (`norm_ppf`) implements the Beasley-Springer-Moro algorithm to achieve
-high precision (~7 decimal places) without requiring external libraries like `scipy`.
+The Inverse CDF (`norm_ppf`) uses Wichura's AS241 algorithm from the standard library
+(`statistics.NormalDist`), accurate to full double precision without requiring external
+libraries like `scipy`.
 """
 
+import heapq
 import math
+import statistics
+from typing import Iterable, Sequence
+
+# Partial selection is used when at most 1/ratio of the data must be ordered
+_PARTIAL_SELECT_RATIO = 32
+
+# Precomputed Gaussian constants (avoid a sqrt per PDF/CDF evaluation)
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+# Standard normal used for the inverse CDF (C-accelerated in CPython)
+_STANDARD_NORMAL = statistics.NormalDist()
 
 # --- 1. Gaussian Functions (Normal Distribution) ---
 
@@ -36,7 +50,7 @@ def norm_pdf(x: float) -> float:
     Returns:
         float: The probability density at x.
     """
-    return math.exp(-0.5 * x**2) / math.sqrt(2.0 * math.pi)
+    return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
 
 
 def norm_cdf(x: float) -> float:
@@ -46,11 +60,13 @@ def norm_cdf(x: float) -> float:
     This represents the probability that a standard normal random variable $Z$ takes
     a value less than or equal to $x$ ($P(Z \le x)$).
 
-    It uses the Error Function (`math.erf`), which is part of the Python standard library,
-    ensuring high precision and performance without external C extensions.
+    It uses the Complementary Error Function (`math.erfc`), which is part of the Python
+    standard library, ensuring high precision and performance without external C extensions.
+    Unlike $1 + \text{erf}$, it does not cancel in the left tail, so deep out-of-the-money
+    probabilities keep full relative precision instead of rounding to 0.
 
     Formula:
-    $$ \Phi(x) = \frac{1}{2} \left[ 1 + \text{erf}\left( \frac{x}{\sqrt{2}} \right) \right] $$
+    $$ \Phi(x) = \frac{1}{2} \text{erfc}\left( -\frac{x}{\sqrt{2}} \right) $$
 
     Args:
         x (float): The upper bound of the integral.
@@ -58,7 +74,7 @@ def norm_cdf(x: float) -> float:
     Returns:
         float: The cumulative probability (value between 0.0 and 1.0).
     """
-    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+    return 0.5 * math.erfc(-x * _INV_SQRT2)
 
 
 def norm_ppf(p: float) -> float:
@@ -70,9 +86,9 @@ def norm_ppf(p: float) -> float:
     generating random numbers in Monte Carlo simulations.
 
     Implementation:
-    It uses the **Beasley-Springer-Moro** rational approximation algorithm, which is
-    standard in quantitative finance for high accuracy (typically ~7 decimal places)
-    without heavy dependencies.
+    It uses **Wichura's AS241** rational approximations as shipped in the standard
+    library (`statistics.NormalDist.inv_cdf`), accurate to about 1e-16 relative
+    error, including the far tails, and faster than a pure-Python approximation.
 
     Args:
         p (float): The cumulative probability. Must be in the range (0, 1).
@@ -86,44 +102,56 @@ def norm_ppf(p: float) -> float:
     if p <= 0.0 or p >= 1.0:
         raise ValueError("Probability p must be between 0 and 1 exclusive.")
 
-    # Constants for the Beasley-Springer-Moro approximation
-    a0, a1, a2, a3 = 2.50662823884, -18.61500062529, 41.39119773534, -25.44106049637
-    b0, b1, b2, b3 = -8.47351093090, 23.08336743743, -21.06224101826, 3.13082909833
-    c0, c1, c2, c3 = 0.33747548227, 0.97616901909, 0.16079797149, 0.02764388103
-    c4, c5, c6, c7, c8 = 0.00384057293, 0.00039518965, 0.00003217678, 0.00000028881, 0.00000039603
-
-    y = p - 0.5
-    if abs(y) < 0.42:
-        r = y * y
-        return (
-            y
-            * (((a3 * r + a2) * r + a1) * r + a0)
-            / ((((b3 * r + b2) * r + b1) * r + b0) * r + 1.0)
-        )
-    else:
-        if y > 0:
-            r = 1.0 - p
-        else:
-            r = p
+    return _STANDARD_NORMAL.inv_cdf(p)
+
+
+def norm_cdfs(xs: Iterable[float]) -> list[float]:
+    """
+    Evaluates `norm_cdf` over a batch of points (e.g. one per scenario or cash flow).
+
+    Args:
+        xs (Iterable[float]): The upper bounds of the integral.
 
-        r = math.log(-math.log(r))
-        z = c0 + r * (c1 + r * (c2 + r * (c3 + r * (c4 + r * (c5 + r * (c6 + r * (c7 + r * c8)))))))
+    Returns:
+        list[float]: One cumulative probability per point, in the same order.
+    """
+    erfc = math.erfc
+    return [0.5 * erfc(-x * _INV_SQRT2) for x in xs]
 
-        if y < 0:
-            return -z
-        else:
-            return z
+
+def norm_ppfs(ps: Iterable[float]) -> list[float]:
+    r"""
+    Evaluates `norm_ppf` over a batch of probabilities (e.g. quasi-random uniforms).
+
+    The whole batch is validated up front, so no result is returned if any
+    probability is out of range.
+
+    Args:
+        ps (Iterable[float]): The cumulative probabilities, each in the range (0, 1).
+
+    Returns:
+        list[float]: One z-score per probability, in the same order.
+
+    Raises:
+        ValueError: If any $p \le 0$ or $p \ge 1$.
+    """
+    probabilities = list(ps)
+    if probabilities and (min(probabilities) <= 0.0 or max(probabilities) >= 1.0):
+        raise ValueError("Probability p must be between 0 and 1 exclusive.")
+
+    inv_cdf = _STANDARD_NORMAL.inv_cdf
+    return [inv_cdf(p) for p in probabilities]
 
 
 # --- 2. Descriptive Statistics ---
 
 
-def mean(data: list[float]) -> float:
+def mean(data: Sequence[float]) -> float:
     """
     Calculates the arithmetic mean of a dataset.
 
     Args:
-        data (list[float]): A list of numerical values.
+        data (Sequence[float]): A sequence of numerical values.
 
     Returns:
         float: The mean value.
@@ -156,7 +184,7 @@ def variance(data: list[float], is_sample: bool = True) -> float:
         raise ValueError("Variance requires at least two data points")
 
     mu = mean(data)
-    sum_sq_diff = sum((x - mu) ** 2 for x in data)
+    sum_sq_diff = sum((x - mu) * (x - mu) for x in data)
 
     divisor = (n - 1) if is_sample else n
     return sum_sq_diff / divisor
@@ -227,9 +255,19 @@ def correlation(x: list[float], y: list[float]) -> float:
     Returns:
         float: The correlation coefficient. Returns 0.0 if one of the series has no variation.
     """
-    cov = covariance(x, y, is_sample=True)
-    sx = std_dev(x, is_sample=True)
-    sy = std_dev(y, is_sample=True)
+    n = len(x)
+    if n != len(y):
+        raise ValueError("Lists must have the same length")
+    if n < 2:
+        raise ValueError("Covariance requires at least two data points")
+
+    # Each mean is computed once and shared by the covariance and both deviations
+    # (same sums as `covariance` and `std_dev`, in the same order)
+    mu_x = mean(x)
+    mu_y = mean(y)
+    cov = sum((xi - mu_x) * (yi - mu_y) for xi, yi in zip(x, y, strict=True)) / (n - 1)
+    sx = math.sqrt(sum((xi - mu_x) * (xi - mu_x) for xi in x) / (n - 1))
+    sy = math.sqrt(sum((yi - mu_y) * (yi - mu_y) for yi in y) / (n - 1))
 
     if sx == 0 or sy == 0:
         return 0.0  # Safe default if variation is zero
@@ -237,7 +275,9 @@ def correlation(x: list[float], y: list[float]) -> float:
     return cov / (sx * sy)
 
 
-def percentile(data: list[float], p: float, sorted_data: bool = False) -> float:
+def percentile(
+    data: Sequence[float], p: float, sorted_data: bool = False, overwrite_input: bool = False
+) -> float:
     """
     Calculates the p-th percentile (0 <= p <= 1) using linear interpolation.
 
@@ -245,10 +285,14 @@ def percentile(data: list[float], p: float, sorted_data: bool = False) -> float:
     It is useful for calculating Historical Value at Risk (VaR).
 
     Args:
-        data (list[float]): The input dataset.
+        data (Sequence[float]): The input dataset.
         p (float): The percentile rank (e.g., 0.95 for 95th percentile).
         sorted_data (bool, optional): Optimization flag. If True, assumes the input
             list is already sorted. Defaults to False.
+        overwrite_input (bool, optional): Optimization flag. If True and `data` is a
+            list, it may be sorted in place instead of copied, saving an allocation of
+            the input's size. The caller must not rely on its order afterwards.
+            Defaults to False.
 
     Returns:
         float: The interpolated value at the p-th percentile.
@@ -261,21 +305,34 @@ def percentile(data: list[float], p: float, sorted_data: bool = False) -> float:
     if not (0 <= p <= 1):
         raise ValueError("Percentile p must be between 0 and 1")
 
-    # Sort if not already sorted (Pure Python sort is Timsort: O(N log N))
-    dataset = data if sorted_data else sorted(data)
-    n = len(dataset)
+    n = len(data)
 
     # Calculate virtual index
     k = (n - 1) * p
     f = math.floor(k)
     c = math.ceil(k)
 
+    # Only the order statistics f and c are needed. For tail percentiles (e.g. VaR)
+    # a bounded heap selection, O(N log m), beats a full sort (Timsort: O(N log N)).
+    if sorted_data:
+        d0, d1 = data[f], data[c]
+    elif (c + 1) * _PARTIAL_SELECT_RATIO <= n:
+        lower = heapq.nsmallest(c + 1, data)
+        d0, d1 = lower[f], lower[c]
+    elif (n - f) * _PARTIAL_SELECT_RATIO <= n:
+        upper = heapq.nlargest(n - f, data)  # Descending: upper[j] is rank n - 1 - j
+        d0, d1 = upper[n - 1 - f], upper[n - 1 - c]
+    elif overwrite_input and isinstance(data, list):
+        data.sort()
+        d0, d1 = data[f], data[c]
+    else:
+        dataset = sorted(data)
+        d0, d1 = dataset[f], dataset[c]
+
     if f == c:
-        return dataset[int(k)]
+        return d0
 
     # Linear interpolation between indices f and c
-    d0 = dataset[int(f)]
-    d1 = dataset[int(c)]
     fraction = k - f
 
     return d0 + (d1 - d0) * fraction
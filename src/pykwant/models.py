@@ -135,9 +135,6 @@ def zcb_price(
     if t >= T:
         return 1.0
 
-    a = model.mean_reversion
-    sigma = model.volatility
-
     # 1. Market Discount Factors
     # We use the time-domain curve wrapper passed by the user
     P_0_T = curve(T)
@@ -149,16 +146,53 @@ def zcb_price(
     h = 1e-4
     f_0_t = -(math.log(curve(t + h)) - math.log(curve(t - h))) / (2 * h)
 
-    # 3. B(t, T)
+    return zcb_price_from_market(model, P_0_t, P_0_T, f_0_t, r_t, t, T)
+
+
+def zcb_price_from_market(
+    model: HullWhiteModel,
+    P_0_t: float,
+    P_0_T: float,
+    f_0_t: float,
+    r_t: float,
+    t: float,
+    T: float,
+) -> float:
+    r"""
+    Calculates the Hull-White ZCB price $P(t, T)$ from pre-evaluated market inputs.
+
+    This is the closed-form kernel behind `zcb_price`. When many bonds share the same
+    $(t, T)$ (e.g. one price per simulated short rate), the market discount factors
+    and the forward rate can be read off the curve once and reused for every $r_t$.
+
+    $$ P(t, T) = \frac{P(0, T)}{P(0, t)} \exp\left( B(t, T) (f(0, t) - r_t) - \frac{\sigma^2}{4a} (1 - e^{-2at}) B(t, T)^2 \right) $$
+
+    Args:
+        model (HullWhiteModel): Model parameters.
+        P_0_t (float): Market discount factor $P(0, t)$.
+        P_0_T (float): Market discount factor $P(0, T)$.
+        f_0_t (float): Market instantaneous forward rate $f(0, t)$.
+        r_t (float): The short rate at time t.
+        t (float): Current time in years.
+        T (float): Maturity time in years.
+
+    Returns:
+        float: The ZCB price.
+    """  # noqa: E501
+    if t >= T:
+        return 1.0
+
+    a = model.mean_reversion
+    sigma = model.volatility
+
+    # B(t, T)
     _, B = _calculate_A_B(model, t, T)
 
-    # 4. A(t, T) components
     # drift correction term: sigma^2 / (4a) * (1 - exp(-2at)) * B^2
-    drift_correction = (sigma**2 / (4 * a)) * (1.0 - math.exp(-2 * a * t)) * (B**2)
+    drift_correction = (sigma * sigma / (4 * a)) * (1.0 - math.exp(-2 * a * t)) * (B * B)
 
-    ln_A = math.log(P_0_T / P_0_t) + B * f_0_t - drift_correction
-
-    return math.exp(ln_A - B * r_t)
+    # ln A - B r_t, with the market ratio kept outside the exponential (no log needed)
+    return (P_0_T / P_0_t) * math.exp(B * (f_0_t - r_t) - drift_correction)
 
 
 def simulate_short_rate_paths(
@@ -191,8 +225,9 @@ def simulate_short_rate_paths(
     Returns:
         List[RatePath]: List of short rate paths.
     """
-    if seed is not None:
-        random.seed(seed)
+    # A dedicated generator keeps seeded runs reproducible without touching the
+    # global `random` state; unseeded runs keep drawing from the module RNG.
+    gauss = random.Random(seed).gauss if seed is not None else random.gauss
 
     a = model.mean_reversion
     sigma = model.volatility
@@ -226,19 +261,21 @@ def simulate_short_rate_paths(
     std_step = math.sqrt(variance_step)
 
     all_paths = []
+    step_alphas = alphas[1:]
 
     for _ in range(num_paths):
-        x = 0.0  # x_0 is always 0
-        path = []
+        # Shocks are drawn path by path, in time order, already scaled by the
+        # step deviation (gauss(0, s) returns s * z for the same draw z)
+        shocks = [gauss(0.0, std_step) for _ in range(steps)]
 
-        for i in range(steps + 1):
-            # r_t = x_t + alpha(t)
-            r_t = x + alphas[i]
-            path.append(r_t)
+        x = 0.0  # x_0 is always 0
+        path = [alphas[0]]
+        append = path.append
 
-            if i < steps:
-                z = random.gauss(0.0, 1.0)
-                x = x * decay + std_step * z
+        # r_t = x_t + alpha(t)
+        for shock, alpha in zip(shocks, step_alphas, strict=True):
+            x = x * decay + shock
+            append(x + alpha)
 
         all_paths.append(path)
 
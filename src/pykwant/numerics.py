@@ -15,12 +15,55 @@ focuses on creating composable *Callables*.
 """
 
 import math
+from bisect import bisect_left
 from typing import Callable, Optional
 
 # Define a type alias for scalar functions f: float -> float
 ScalarFunction = Callable[[float], float]
 
 
+def _piecewise_linear(
+    x_data: list[float], y_data: list[float], extrapolate: bool
+) -> ScalarFunction:
+    """
+    Internal builder of the piecewise linear interpolator shared by both public
+    interpolation functions (validation, segment slopes, bracket search).
+    """
+    if len(x_data) != len(y_data):
+        raise ValueError("x_data and y_data must have the same length.")
+
+    # We assume x_data is sorted for performance.
+    # In production, a check or sort could be added (but might break alignment with y).
+
+    # Capture data in the closure (tuples for immutability), together with the
+    # slope of every segment so queries do not recompute it.
+    xs = tuple(x_data)
+    ys = tuple(y_data)
+    slopes = tuple(
+        (y1 - y0) / (x1 - x0) if x1 != x0 else math.nan
+        for x0, x1, y0, y1 in zip(xs[:-1], xs[1:], ys[:-1], ys[1:], strict=True)
+    )
+    x_first, x_last = xs[0], xs[-1]
+
+    def _interpolator(x: float) -> float:
+        # Handle extrapolation / boundaries (first and last segment slopes)
+        if x <= x_first:
+            if not extrapolate and x < x_first:
+                return math.nan
+            return ys[0] + slopes[0] * (x - x_first)
+
+        if x >= x_last:
+            if not extrapolate and x > x_last:
+                return math.nan
+            return ys[-1] + slopes[-1] * (x - x_last)
+
+        # Binary search for the segment i such that xs[i] < x <= xs[i + 1]
+        i = bisect_left(xs, x) - 1
+        return ys[i] + slopes[i] * (x - xs[i])
+
+    return _interpolator
+
+
 def linear_interpolation(
     x_data: list[float], y_data: list[float], extrapolate: bool = True
 ) -> ScalarFunction:
@@ -43,47 +86,7 @@ def linear_interpolation(
     Raises:
         ValueError: If x_data and y_data have different lengths.
     """
-    if len(x_data) != len(y_data):
-        raise ValueError("x_data and y_data must have the same length.")
-
-    # We assume x_data is sorted for performance.
-    # In production, a check or sort could be added (but might break alignment with y).
-
-    # Capture data in the closure (tuple for immutability and slight perf gain)
-    xs = tuple(x_data)
-    ys = tuple(y_data)
-    n = len(xs)
-
-    def _interpolator(x: float) -> float:
-        # Handle extrapolation / boundaries
-        if x <= xs[0]:
-            if not extrapolate and x < xs[0]:
-                return float("nan")
-            # Slope of the first segment
-            slope = (ys[1] - ys[0]) / (xs[1] - xs[0])
-            return ys[0] + slope * (x - xs[0])
-
-        if x >= xs[-1]:
-            if not extrapolate and x > xs[-1]:
-                return float("nan")
-            # Slope of the last segment
-            slope = (ys[-1] - ys[-2]) / (xs[-1] - xs[-2])
-            return ys[-1] + slope * (x - xs[-1])
-
-        # Binary or linear search for the segment
-        # Using linear search here for simplicity (can be optimized with bisect)
-        i = 0
-        while i < n - 1 and xs[i + 1] < x:
-            i += 1
-
-        # Interpolate between i and i+1
-        x0, x1 = xs[i], xs[i + 1]
-        y0, y1 = ys[i], ys[i + 1]
-
-        slope = (y1 - y0) / (x1 - x0)
-        return y0 + slope * (x - x0)
-
-    return _interpolator
+    return _piecewise_linear(x_data, y_data, extrapolate)
 
 
 def log_linear_interpolation(
@@ -104,17 +107,13 @@ def log_linear_interpolation(
     Returns:
         ScalarFunction: A function `f(x) -> y`.
     """
-    # Transform to logarithmic space
-    log_ys = [math.log(y) for y in y_data]
-
-    # Create the linear interpolator on the transformed space
-    lin_interp = linear_interpolation(x_data, log_ys, extrapolate)
+    # Transform to logarithmic space once; the slopes are precomputed there
+    lin_interp = _piecewise_linear(x_data, list(map(math.log, y_data)), extrapolate)
+    exp = math.exp
 
     def _log_interpolator(x: float) -> float:
-        val = lin_interp(x)
-        if math.isnan(val):
-            return val
-        return math.exp(val)
+        # exp(nan) is nan, so disabled extrapolation needs no special case
+        return exp(lin_interp(x))
 
     return _log_interpolator
 
@@ -150,8 +149,9 @@ def newton_solve(
     """
     Finds the root $x$ such that $func(x) = target$ using the Newton-Raphson method.
 
-    Calculates the derivative (gradient) on the fly using `numerical_derivative`,
-    so the user does not need to provide an explicit gradient function.
+    Calculates the derivative (gradient) on the fly with the same central difference
+    as `numerical_derivative`, so the user does not need to provide an explicit
+    gradient function.
 
     Args:
         func (ScalarFunction): The objective function f(x).
@@ -164,21 +164,20 @@ def newton_solve(
         Optional[float]: The found value x, or None if the algorithm fails to converge.
     """
 
-    # Objective function: g(x) = f(x) - target = 0
-    def objective(x: float) -> float:
-        return func(x) - target
-
-    # Automatically obtain the derivative
-    grad = numerical_derivative(objective)
+    # Objective function g(x) = f(x) - target = 0, with its derivative taken by
+    # central differences as in `numerical_derivative`. Both are inlined in the
+    # loop (same arithmetic) to avoid two closure layers per function evaluation.
+    h = 1e-5
+    two_h = 2 * h
 
     x_curr = guess
     for _ in range(max_iter):
-        y_val = objective(x_curr)
+        y_val = func(x_curr) - target
 
         if abs(y_val) < tol:
             return x_curr
 
-        slope = grad(x_curr)
+        slope = ((func(x_curr + h) - target) - (func(x_curr - h) - target)) / two_h
         if slope == 0:
             return None  # Zero gradient, cannot proceed
 
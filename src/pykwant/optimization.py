@@ -15,9 +15,10 @@ This approach is "Zero-Dependency" and relies on pure Python math.
 """
 
 import math
+import operator
 import random
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Callable, List, Tuple
 
 # --- Data Structures ---
 
@@ -43,11 +44,32 @@ def _portfolio_variance(weights: List[float], cov_matrix: List[List[float]]) ->
 
     $$ \sigma_p^2 = \sum_i \sum_j w_i w_j \sigma_{ij} $$
     """
-    variance = 0.0
-    n = len(weights)
-    for i in range(n):
-        for j in range(n):
-            variance += weights[i] * weights[j] * cov_matrix[i][j]
+    return _folded_variance(weights, _fold_covariance(cov_matrix))
+
+
+def _fold_covariance(cov_matrix: List[List[float]]) -> List[List[float]]:
+    r"""
+    Internal helper folding a covariance matrix onto its upper triangle.
+
+    Row i holds $\sigma_{ii}$ followed by $\sigma_{ij} + \sigma_{ji}$ for $j > i$, so
+    the quadratic form needs n(n+1)/2 products instead of n^2.
+    """
+    n = len(cov_matrix)
+    return [
+        [cov_matrix[i][i]] + [cov_matrix[i][j] + cov_matrix[j][i] for j in range(i + 1, n)]
+        for i in range(n)
+    ]
+
+
+def _folded_variance(weights: List[float], folded_cov: List[List[float]]) -> float:
+    """
+    Internal helper evaluating w^T * Sigma * w on a matrix from `_fold_covariance`.
+    """
+    mul = operator.mul
+    variance: float = sum(
+        w_i * sum(map(mul, row, weights[i:]))
+        for i, (w_i, row) in enumerate(zip(weights, folded_cov, strict=True))
+    )
     return variance
 
 
@@ -61,13 +83,36 @@ def _portfolio_return(weights: List[float], expected_returns: List[float]) -> fl
 def generate_random_weights(n: int) -> List[float]:
     """
     Generates N random weights that sum to 1.0 (Long Only).
+
+    Weights are drawn uniformly over the long-only simplex (a flat Dirichlet).
     """
-    # Generate random numbers
-    raw = [random.random() for _ in range(n)]
-    total = sum(raw)
+    return _random_weights(n, random.random)
+
 
-    # Normalize
-    return [x / total for x in raw]
+def _random_weights(n: int, rand: Callable[[], float]) -> List[float]:
+    """
+    Internal helper drawing N long-only weights uniformly over the simplex.
+
+    Uses uniform spacings: N-1 sorted uniform cut points split [0, 1] into N
+    pieces, whose lengths follow a flat Dirichlet distribution. Normalizing raw
+    uniforms instead would crowd draws around equal weights and rarely visit
+    the corner (concentrated) portfolios the optimizer is often looking for.
+    """
+    if n <= 0:
+        return []
+
+    # Sorted cut points in [0, 1), closed by 1.0
+    cuts = [rand() for _ in range(n - 1)]
+    cuts.sort()
+    cuts.append(1.0)
+
+    # Spacings telescope to 1.0 (up to rounding), with no division
+    weights = []
+    prev = 0.0
+    for cut in cuts:
+        weights.append(cut - prev)
+        prev = cut
+    return weights
 
 
 def optimize_portfolio_monte_carlo(
@@ -94,13 +139,17 @@ def optimize_portfolio_monte_carlo(
     Returns:
         Tuple[PortfolioStats, PortfolioStats]: (Max Sharpe Portfolio, Min Vol Portfolio).
     """
-    if seed is not None:
-        random.seed(seed)
+    # A private generator keeps seeded runs reproducible without reseeding the
+    # global `random` state; it draws the same sequence as `random.seed(seed)`.
+    rand = random.Random(seed).random if seed is not None else random.random
 
     n_assets = len(expected_returns)
     if len(cov_matrix) != n_assets or len(cov_matrix[0]) != n_assets:
         raise ValueError("Covariance matrix dimensions must match number of assets.")
 
+    # The covariance is loop-invariant: fold it once for all simulated portfolios
+    folded_cov = _fold_covariance(cov_matrix)
+
     # Trackers for optimal portfolios
     max_sharpe_stats = None
     max_sharpe_val = -float("inf")
@@ -109,11 +158,11 @@ def optimize_portfolio_monte_carlo(
     min_vol_val = float("inf")
 
     for _ in range(num_portfolios):
-        weights = generate_random_weights(n_assets)
+        weights = _random_weights(n_assets, rand)
 
         # Calculate Stats
         p_ret = _portfolio_return(weights, expected_returns)
-        p_var = _portfolio_variance(weights, cov_matrix)
+        p_var = _folded_variance(weights, folded_cov)
         p_vol = math.sqrt(p_var)
 
         # Calculate Sharpe (handle zero vol edge case)
@@ -122,17 +171,15 @@ def optimize_portfolio_monte_carlo(
         else:
             p_sharpe = 0.0
 
-        current_stats = PortfolioStats(weights, p_ret, p_vol, p_sharpe)
-
-        # Check Max Sharpe
+        # Check Max Sharpe (stats are only materialized for new optima)
         if p_sharpe > max_sharpe_val:
             max_sharpe_val = p_sharpe
-            max_sharpe_stats = current_stats
+            max_sharpe_stats = PortfolioStats(weights, p_ret, p_vol, p_sharpe)
 
         # Check Min Volatility
         if p_vol < min_vol_val:
             min_vol_val = p_vol
-            min_vol_stats = current_stats
+            min_vol_stats = PortfolioStats(weights, p_ret, p_vol, p_sharpe)
 
     # Should generally not happen unless num_portfolios is 0
     if max_sharpe_stats is None or min_vol_stats is None:
@@ -14,9 +14,10 @@ Key Concepts:
 - **Portfolio**: A `list[Position]`.
 """
 
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date
-from typing import Dict, List, TypeAlias
+from typing import DefaultDict, Dict, List, TypeAlias
 
 from pykwant import instruments, rates, risk
 
@@ -41,6 +42,26 @@ class Position:
 Portfolio: TypeAlias = List[Position]
 
 
+def _unit_prices(
+    portfolio: Portfolio, curve: rates.YieldCurveFn, valuation_date: date
+) -> Dict[instruments.Instrument, float]:
+    """
+    Internal helper pricing each distinct instrument of the portfolio exactly once.
+
+    Instruments are immutable dataclasses, so they key the result directly: several
+    positions in the same (or an equal) instrument share a single pricing call.
+    Discount factors are memoized too, as cash flows often share payment dates.
+    """
+    curve = rates.memoized_curve(curve)
+    prices: Dict[instruments.Instrument, float] = {}
+    for pos in portfolio:
+        if pos.instrument not in prices:
+            prices[pos.instrument] = instruments.price_instrument(
+                pos.instrument, curve, valuation_date
+            )
+    return prices
+
+
 def portfolio_npv(portfolio: Portfolio, curve: rates.YieldCurveFn, valuation_date: date) -> float:
     r"""
     Calculates the Total Net Present Value (NPV) of a portfolio.
@@ -56,10 +77,10 @@ def portfolio_npv(portfolio: Portfolio, curve: rates.YieldCurveFn, valuation_dat
     Returns:
         float: The total market value of the portfolio.
     """
+    prices = _unit_prices(portfolio, curve, valuation_date)
     total_value = 0.0
     for pos in portfolio:
-        price = instruments.price_instrument(pos.instrument, curve, valuation_date)
-        total_value += price * pos.quantity
+        total_value += prices[pos.instrument] * pos.quantity
     return total_value
 
 
@@ -89,9 +110,17 @@ def portfolio_risk(
     total_dv01 = 0.0
     weighted_duration_sum = 0.0
 
+    # Each distinct instrument (and its bumped repricings) is valued only once, and
+    # base discount factors on shared payment dates are computed only once
+    curve = rates.memoized_curve(curve)
+    metrics_by_instrument: Dict[instruments.Instrument, Dict[str, float]] = {}
+
     for pos in portfolio:
         # Calculate metrics for the single instrument
-        metrics = risk.calculate_risk_metrics(pos.instrument, curve, valuation_date)
+        metrics = metrics_by_instrument.get(pos.instrument)
+        if metrics is None:
+            metrics = risk.calculate_risk_metrics(pos.instrument, curve, valuation_date)
+            metrics_by_instrument[pos.instrument] = metrics
 
         position_value = metrics["price"] * pos.quantity
         position_dv01 = metrics["dv01"] * pos.quantity
@@ -133,27 +162,24 @@ def exposure_by_maturity_year(
         Dict[int, float]: A dictionary mapping Year -> Total NPV for that year.
         Example: {2025: 1500.0, 2026: -500.0}
     """
-    exposure: Dict[int, float] = {}
+    prices = _unit_prices(portfolio, curve, valuation_date)
+    exposure: DefaultDict[int, float] = defaultdict(float)
 
     for pos in portfolio:
-        # Determine maturity year based on instrument type
-        maturity_year = 0
+        instrument = pos.instrument
 
-        if hasattr(pos.instrument, "maturity_date"):
+        # Determine maturity year based on instrument type
+        if hasattr(instrument, "maturity_date"):
             # Works for FixedRateBond and similar
-            maturity_year = pos.instrument.maturity_date.year
-        elif hasattr(pos.instrument, "expiry_date"):
+            maturity_year = instrument.maturity_date.year
+        elif hasattr(instrument, "expiry_date"):
             # Works for Options
-            maturity_year = pos.instrument.expiry_date.year
+            maturity_year = instrument.expiry_date.year
         else:
             # Fallback for instruments without clear maturity (e.g. Cash)
             maturity_year = valuation_date.year
 
-        # Calculate Value
-        price = instruments.price_instrument(pos.instrument, curve, valuation_date)
-        value = price * pos.quantity
-
-        # Accumulate in bucket
-        exposure[maturity_year] = exposure.get(maturity_year, 0.0) + value
+        # Accumulate in bucket (a single in-place update per position)
+        exposure[maturity_year] += prices[instrument] * pos.quantity
 
-    return exposure
+    return dict(exposure)
@@ -10,12 +10,14 @@ mapping a date to a Discount Factor:
     `f(date) -> float`
 
 This allows curves to be composed, interpolated, or mocked easily without
-complex inheritance hierarchies.
+complex inheritance hierarchies. Curves that can evaluate many dates at once more
+cheaply may additionally expose a `discount_factors(dates)` method (see
+`BatchYieldCurve`); `discount_factors` uses it when present.
 """
 
 import math
 from datetime import date
-from typing import Callable, TypeAlias
+from typing import Callable, List, Protocol, Sequence, TypeAlias
 
 from pykwant import dates, numerics
 
@@ -23,6 +25,19 @@ from pykwant import dates, numerics
 YieldCurveFn: TypeAlias = Callable[[date], float]
 
 
+class BatchYieldCurve(Protocol):
+    """
+    Optional protocol for yield curves with a batch evaluation method.
+
+    Any `YieldCurveFn` may additionally provide `discount_factors` to price a whole
+    sequence of dates in one call (e.g., sharing interpolation work across dates).
+    """
+
+    def __call__(self, d: date) -> float: ...
+
+    def discount_factors(self, dates_list: Sequence[date]) -> Sequence[float]: ...
+
+
 def compound_factor(rate: float, t: float, frequency: int = 0) -> float:
     """
     Calculates the compounding factor for a given rate and time.
@@ -46,6 +61,91 @@ def compound_factor(rate: float, t: float, frequency: int = 0) -> float:
     return float((1 + rate / frequency) ** (frequency * t))
 
 
+def discount_factors(curve: YieldCurveFn, dates_list: Sequence[date]) -> List[float]:
+    """
+    Evaluates a yield curve on a sequence of dates.
+
+    Uses the curve's batch `discount_factors` method when it implements
+    `BatchYieldCurve`, and falls back to one call per date otherwise.
+
+    Args:
+        curve (YieldCurveFn): The yield curve function.
+        dates_list (Sequence[date]): The dates to discount.
+
+    Returns:
+        List[float]: The discount factors, aligned with `dates_list`.
+    """
+    batch = getattr(curve, "discount_factors", None)
+    if batch is not None:
+        return list(batch(dates_list))
+    return [curve(d) for d in dates_list]
+
+
+class _MemoizedBatchCurve:
+    """
+    Internal memoizing wrapper for curves implementing `BatchYieldCurve`.
+
+    Scalar calls and batch calls share one per-date cache; dates missing from it
+    are evaluated with a single call to the wrapped curve's batch method.
+    """
+
+    __slots__ = ("_curve", "_batch", "_cache")
+
+    def __init__(
+        self, curve: YieldCurveFn, batch: Callable[[Sequence[date]], Sequence[float]]
+    ) -> None:
+        self._curve = curve
+        self._batch = batch
+        self._cache: dict[date, float] = {}
+
+    def __call__(self, d: date) -> float:
+        df = self._cache.get(d)
+        if df is None:
+            df = self._cache[d] = self._curve(d)
+        return df
+
+    def discount_factors(self, dates_list: Sequence[date]) -> List[float]:
+        cache = self._cache
+        missing = [d for d in dict.fromkeys(dates_list) if d not in cache]
+        if missing:
+            cache.update(zip(missing, self._batch(missing), strict=True))
+        return [cache[d] for d in dates_list]
+
+
+def memoized_curve(curve: YieldCurveFn) -> YieldCurveFn:
+    """
+    Wraps a yield curve so each distinct date is evaluated only once.
+
+    Cash flows of different instruments often fall on the same dates (e.g. annual
+    coupons on a common anniversary). A short-lived memoized curve, created for one
+    portfolio valuation, turns those repeated evaluations into dictionary lookups.
+    The cache is unbounded, so the wrapper should not outlive the valuation.
+
+    When the curve implements `BatchYieldCurve`, the wrapper keeps a
+    `discount_factors` method too: dates not yet cached are evaluated with one
+    batch call, so `discount_factors` still reaches the curve's batch path.
+
+    Args:
+        curve (YieldCurveFn): The yield curve function to wrap.
+
+    Returns:
+        YieldCurveFn: A callable `f(date) -> discount_factor` with the same values.
+    """
+    batch = getattr(curve, "discount_factors", None)
+    if batch is not None:
+        return _MemoizedBatchCurve(curve, batch)
+
+    cache: dict[date, float] = {}
+
+    def _curve(d: date) -> float:
+        df = cache.get(d)
+        if df is None:
+            df = cache[d] = curve(d)
+        return df
+
+    return _curve
+
+
 def create_curve_from_discount_factor(
     reference_date: date,
     dates_list: list[date],
@@ -74,6 +174,18 @@ def create_curve_from_discount_factor(
     # Create a log-linear interpolator: f(t) -> DF
     interpolator = numerics.log_linear_interpolation(times, dfs_list)
 
+    if day_count is dates.act_365:
+        # ACT/365 year fractions straight from ordinals: queries then cost one
+        # subtraction before the interpolator (same values as `dates.act_365`)
+        ref_ordinal = reference_date.toordinal()
+
+        def _act_365_curve(d: date) -> float:
+            if d == reference_date:
+                return 1.0
+            return interpolator((d.toordinal() - ref_ordinal) / 365.0)
+
+        return _act_365_curve
+
     # Define the closure that acts as the Yield Curve
     def _curve(d: date) -> float:
         if d == reference_date:
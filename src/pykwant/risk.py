@@ -11,15 +11,15 @@ and Convexity ($\partial^2 P / \partial r^2$).
 
 Key Features:
 - **Generic**: Works for any instrument that can be priced.
-- **Consistent**: Uses the same `numerics` engine as the rest of the library.
+- **Consistent**: Central differences with the same step as `numerics.numerical_derivative`.
 - **Functional**: Returns risk metrics as pure values without modifying instruments.
 """
 
 import math
 from datetime import date
-from typing import Dict
+from typing import Dict, Iterable
 
-from pykwant import dates, instruments, numerics, rates
+from pykwant import dates, instruments, rates
 
 
 def _shift_curve(
@@ -38,23 +38,88 @@ def _shift_curve(
 
     Returns:
         YieldCurveFn: A new closure `f(date) -> df` representing the shifted curve.
+        Results are memoized per date, so the base curve must be deterministic.
     """
 
+    # Cash-flow dates repeat across repricings, so each date is shifted once.
+    memo: Dict[date, float] = {}
+
     def _shifted_curve(d: date) -> float:
+        cached = memo.get(d)
+        if cached is not None:
+            return cached
+
         original_df = curve(d)
         if d == reference_date:
-            return original_df
+            shifted_df = original_df
+        else:
+            # We standardise the shift application using ACT/365
+            t = dates.act_365(reference_date, d)
 
-        # We standardise the shift application using ACT/365
-        t = dates.act_365(reference_date, d)
+            # New DF = Old DF * exp(-shift * t)
+            # This corresponds to r_new = r_old + shift
+            shifted_df = original_df * math.exp(-shift * t)
 
-        # New DF = Old DF * exp(-shift * t)
-        # This corresponds to r_new = r_old + shift
-        return original_df * math.exp(-shift * t)
+        memo[d] = shifted_df
+        return shifted_df
 
     return _shifted_curve
 
 
+# Step of the central differences used for duration and convexity
+_DERIV_STEP = 1e-4
+
+
+def _price_at_shifts(
+    instrument: instruments.Instrument,
+    curve: rates.YieldCurveFn,
+    valuation_date: date,
+    shifts: Iterable[float],
+) -> Dict[float, float]:
+    """
+    Prices an instrument under several parallel shifts of the same curve.
+
+    The base curve is memoized once for all shifts, so each cash-flow date is
+    looked up on it a single time however many bumped repricings are needed.
+    Repeated shifts are priced once.
+
+    Returns:
+        Dict[float, float]: Price keyed by shift.
+    """
+    base = rates.memoized_curve(curve)
+    prices: Dict[float, float] = {}
+    for s in shifts:
+        if s not in prices:
+            shifted = _shift_curve(base, s, valuation_date)
+            prices[s] = float(instruments.price_instrument(instrument, shifted, valuation_date))
+    return prices
+
+
+def _duration_from_prices(prices: Dict[float, float], h: float) -> float:
+    """Internal helper: effective duration from prices at shifts 0 and +/-h."""
+    current_price = prices[0.0]
+    if current_price == 0:
+        return 0.0
+
+    # Central difference: dP/dy ~ (P(+h) - P(-h)) / 2h
+    dp_dy = (prices[h] - prices[-h]) / (2 * h)
+    return -dp_dy / current_price
+
+
+def _convexity_from_prices(prices: Dict[float, float], h: float) -> float:
+    """Internal helper: effective convexity from prices at shifts 0, +/-2h."""
+    current_price = prices[0.0]
+    if current_price == 0:
+        return 0.0
+
+    # Central difference of the central first derivatives at +/-h:
+    # d2P/dy2 ~ ((P(+2h) - P(0)) / 2h - (P(0) - P(-2h)) / 2h) / 2h
+    dp_dy_up = (prices[2 * h] - current_price) / (2 * h)
+    dp_dy_down = (current_price - prices[-2 * h]) / (2 * h)
+    d2p_dy2 = (dp_dy_up - dp_dy_down) / (2 * h)
+    return d2p_dy2 / current_price
+
+
 def pv01(
     instrument: instruments.Instrument,
     curve: rates.YieldCurveFn,
@@ -78,14 +143,8 @@ def pv01(
     Returns:
         float: The change in value (usually negative for long bond positions).
     """
-    # Price with base curve
-    p_base = instruments.price_instrument(instrument, curve, valuation_date)
-
-    # Price with shifted curve
-    shifted_curve = _shift_curve(curve, bump, valuation_date)
-    p_bumped = instruments.price_instrument(instrument, shifted_curve, valuation_date)
-
-    return p_bumped - p_base
+    prices = _price_at_shifts(instrument, curve, valuation_date, (0.0, bump))
+    return prices[bump] - prices[0.0]
 
 
 def effective_duration(
@@ -109,21 +168,9 @@ def effective_duration(
         float: The duration in years (e.g., 4.5). Returns 0.0 if price is 0.
     """
 
-    # Define Price as a function of the shift 's'
-    def price_vs_shift(s: float) -> float:
-        shifted = _shift_curve(curve, s, valuation_date)
-        return float(instruments.price_instrument(instrument, shifted, valuation_date))
-
-    current_price = price_vs_shift(0.0)
-    if current_price == 0:
-        return 0.0
-
-    # Calculate first derivative dP/dy at s=0
-    # We use a slightly larger step (h=1e-4) for stability in financial contexts
-    deriv_fn = numerics.numerical_derivative(price_vs_shift, h=1e-4)
-    dp_dy = deriv_fn(0.0)
-
-    return -dp_dy / current_price
+    h = _DERIV_STEP
+    prices = _price_at_shifts(instrument, curve, valuation_date, (0.0, h, -h))
+    return _duration_from_prices(prices, h)
 
 
 def effective_convexity(
@@ -146,22 +193,9 @@ def effective_convexity(
         float: The convexity value.
     """
 
-    # Define Price as a function of the shift 's'
-    def price_vs_shift(s: float) -> float:
-        shifted = _shift_curve(curve, s, valuation_date)
-        return float(instruments.price_instrument(instrument, shifted, valuation_date))
-
-    current_price = price_vs_shift(0.0)
-    if current_price == 0:
-        return 0.0
-
-    # Calculate second derivative d2P/dy2 at s=0
-    first_deriv = numerics.numerical_derivative(price_vs_shift, h=1e-4)
-    second_deriv = numerics.numerical_derivative(first_deriv, h=1e-4)
-
-    d2p_dy2 = second_deriv(0.0)
-
-    return d2p_dy2 / current_price
+    h = _DERIV_STEP
+    prices = _price_at_shifts(instrument, curve, valuation_date, (0.0, 2 * h, -2 * h))
+    return _convexity_from_prices(prices, h)
 
 
 def calculate_risk_metrics(
@@ -174,7 +208,8 @@ def calculate_risk_metrics(
     Computes a comprehensive risk report for a single instrument.
 
     This utility function aggregates Price, Duration, Convexity, and DV01
-    into a single dictionary, avoiding redundant recalculations where possible.
+    into a single dictionary. All metrics are derived from one set of bumped
+    prices, so each shift is priced only once.
 
     Args:
         instruments (Instrument): The instrument to analyze.
@@ -186,13 +221,15 @@ def calculate_risk_metrics(
         Dict[str, float]: A dictionary containing keys:
             'price', 'duration', 'convexity', 'dv01'.
     """
-    # Note: For maximum efficiency, we could reuse the same pricing calls
-    # for duration and convexity (e.g. calculating P_up and P_down once).
-    # Here we favor code clarity and reuse of the specific functions.
-
-    price = instruments.price_instrument(instrument, curve, valuation_date)
-    dur = effective_duration(instrument, curve, valuation_date)
-    conv = effective_convexity(instrument, curve, valuation_date)
-    dv01_val = pv01(instrument, curve, valuation_date, bump)
+    # One set of bumped prices serves every metric: duration needs +/-h,
+    # convexity +/-2h and DV01 the bump (shared with +h at the default 1bp).
+    h = _DERIV_STEP
+    shifts = (0.0, h, -h, 2 * h, -2 * h, bump)
+    prices = _price_at_shifts(instrument, curve, valuation_date, shifts)
+
+    price = prices[0.0]
+    dur = _duration_from_prices(prices, h)
+    conv = _convexity_from_prices(prices, h)
+    dv01_val = prices[bump] - price
 
     return {"price": price, "duration": dur, "convexity": conv, "dv01": dv01_val}
@@ -10,18 +10,170 @@ It follows a functional design using standard Python lists.
 This module is optimized for clarity and educational value rather than raw speed.
 
 Key Functions:
+- `generate_normals`: Draws standard normal shocks (pseudo-random or quasi-random)
+  for reuse across simulations.
 - `generate_paths_gbm`: Simulates Geometric Brownian Motion paths.
 - `monte_carlo_price`: Prices any instrument given paths and a payoff function.
 """
 
 import math
 import random
-from typing import Callable, List
+from collections import deque
+from typing import Callable, List, Literal, Sequence
 
-# Type alias for a single price path (time series)
-Path = List[float]
+from pykwant import math_utils
+
+# Type alias for a single price path (time series).
+# Any indexable float sequence is accepted (list, tuple, array.array, ...), so
+# callers holding paths in a contiguous buffer can price them without copying.
+Path = Sequence[float]
 # Type alias for a Payoff function: takes a Path, returns a float value
 PayoffFn = Callable[[Path], float]
+# Source of the standard normal shocks driving a simulation
+Sampler = Literal["pseudo", "antithetic", "halton"]
+
+
+def _first_primes(n: int) -> List[int]:
+    """Internal helper returning the first `n` prime numbers (Halton bases)."""
+    primes: List[int] = []
+    candidate = 2
+    while len(primes) < n:
+        if all(candidate % p for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def _halton_uniforms(dims: int, num_points: int, rng: random.Random) -> List[List[float]]:
+    """
+    Internal helper generating randomized Halton points in the open cube (0, 1)^dims.
+
+    Each dimension uses the radical inverse in its own prime base with a random
+    digit permutation (keeping 0 fixed), which breaks the strong correlations of
+    plain Halton between high-dimensional bases. A random shift modulo 1 per
+    dimension (Cranley-Patterson rotation) then makes the estimator unbiased.
+    """
+    bases = _first_primes(dims)
+    perms = []
+    for base in bases:
+        digits = list(range(1, base))
+        rng.shuffle(digits)
+        perms.append([0] + digits)
+    shifts = [rng.random() for _ in range(dims)]
+
+    points = []
+    for index in range(1, num_points + 1):
+        point = []
+        for base, perm, shift in zip(bases, perms, shifts, strict=True):
+            value = shift
+            scale = 1.0 / base
+            i = index
+            while i > 0:
+                i, digit = divmod(i, base)
+                value += perm[digit] * scale
+                scale /= base
+            if value >= 1.0:
+                value -= 1.0
+            # Keep strictly inside (0, 1) so the point maps to a finite normal
+            point.append(value if value > 0.0 else scale)
+        points.append(point)
+    return points
+
+
+def _brownian_bridge(steps: int) -> Callable[[List[float]], List[float]]:
+    """
+    Internal factory for a Brownian bridge mapping `steps` normals to unit-time increments.
+
+    The first normal fixes the terminal value W_n, the next ones fill midpoints
+    by bisection. With low-discrepancy inputs this puts the best-distributed
+    coordinates on the coarse shape of the path, where most payoff variance lives.
+    The returned increments are still i.i.d. N(0, 1) in distribution.
+    """
+    # Bisection schedule (mid, left, right, weight, std), computed once
+    schedule = []
+    intervals = deque([(0, steps)])
+    while intervals:
+        left, right = intervals.popleft()
+        if right - left < 2:
+            continue
+        mid = (left + right) // 2
+        weight = (mid - left) / (right - left)
+        std = math.sqrt((mid - left) * (right - mid) / (right - left))
+        schedule.append((mid, left, right, weight, std))
+        intervals.append((left, mid))
+        intervals.append((mid, right))
+
+    terminal_std = math.sqrt(steps)
+
+    def _bridge(z: List[float]) -> List[float]:
+        w = [0.0] * (steps + 1)
+        w[steps] = terminal_std * z[0]
+        for k, (mid, left, right, weight, std) in enumerate(schedule, start=1):
+            w[mid] = w[left] + weight * (w[right] - w[left]) + std * z[k]
+        return [w[i + 1] - w[i] for i in range(steps)]
+
+    return _bridge
+
+
+def generate_normals(
+    steps: int, num_paths: int, seed: int | None = None, sampler: Sampler = "pseudo"
+) -> List[List[float]]:
+    """
+    Draws a `num_paths x steps` matrix of standard normal shocks.
+
+    Passing the same shocks to several `generate_paths_gbm` calls implements
+    **Common Random Numbers**: bumped simulations (e.g. spot or rate +/- h for
+    finite-difference Greeks) share their noise, so the difference of their
+    prices is not swamped by Monte Carlo error.
+
+    Samplers:
+    - `"pseudo"`: independent Gaussian draws. The draw order matches
+      `generate_paths_gbm`, so `generate_normals(steps, num_paths, seed)`
+      reproduces the paths built with `seed`.
+    - `"antithetic"`: **Antithetic Variates**. Each pseudo-random row is followed
+      by its negation, so paths come in mirrored pairs. For payoffs monotone in
+      the shocks (e.g. vanilla options) the pair errors partly cancel and the
+      estimator variance drops, typically by about half at equal path count.
+    - `"halton"`: **Quasi-Monte Carlo**. Scrambled Halton points (one dimension
+      per step) are mapped to normals with `norm_ppf` and arranged with a
+      Brownian bridge. The error of smooth payoffs shrinks close to $O(N^{-1})$
+      instead of $O(N^{-1/2})$, so far fewer paths reach the same accuracy.
+      The seed only drives the scrambling.
+
+    Args:
+        steps (int): Number of time steps per path.
+        num_paths (int): Number of paths.
+        seed (int, optional): Random seed for reproducibility. Defaults to None.
+        sampler (Sampler, optional): `"pseudo"`, `"antithetic"` or `"halton"`.
+            Defaults to `"pseudo"`.
+
+    Returns:
+        List[List[float]]: One list of `steps` shocks per path.
+
+    Raises:
+        ValueError: If the sampler is unknown.
+    """
+    if sampler == "pseudo":
+        gauss = random.Random(seed).gauss if seed is not None else random.gauss
+        return [[gauss(0.0, 1.0) for _ in range(steps)] for _ in range(num_paths)]
+
+    if sampler == "antithetic":
+        gauss = random.Random(seed).gauss if seed is not None else random.gauss
+        normals: List[List[float]] = []
+        for _ in range((num_paths + 1) // 2):
+            row = [gauss(0.0, 1.0) for _ in range(steps)]
+            normals.append(row)
+            normals.append([-z for z in row])
+        # An odd path count keeps the last draw without its mirror
+        return normals[:num_paths]
+
+    if sampler == "halton":
+        rng = random.Random(seed)
+        uniforms = _halton_uniforms(steps, num_paths, rng)
+        bridge = _brownian_bridge(steps)
+        return [bridge(math_utils.norm_ppfs(point)) for point in uniforms]
+
+    raise ValueError(f"Unknown sampler: {sampler!r}")
 
 
 def generate_paths_gbm(
@@ -32,7 +184,9 @@ def generate_paths_gbm(
     steps: int,
     num_paths: int,
     seed: int | None = None,
-) -> List[Path]:
+    normals: Sequence[Sequence[float]] | None = None,
+    sampler: Sampler = "pseudo",
+) -> List[List[float]]:
     r"""
     Generates asset price paths using Geometric Brownian Motion (GBM).
 
@@ -49,14 +203,35 @@ def generate_paths_gbm(
         time_horizon (float): Total time in years ($T$).
         steps (int): Number of time steps per path.
         num_paths (int): Number of independent paths to simulate.
-        seed (int, optional): Random seed for reproducibility. Defaults to None.
+        seed (int, optional): Random seed for reproducibility. To rerun the same
+            shocks under other market parameters (calibration, bump-and-reprice),
+            draw them once with `generate_normals` and pass them as `normals`,
+            which skips the sampling on every call. Defaults to None.
+        normals (Sequence[Sequence[float]], optional): Pre-drawn shocks of shape
+            `(num_paths, steps)`, e.g. from `generate_normals`. When given,
+            `seed` and `sampler` are ignored. Defaults to None.
+        sampler (Sampler, optional): Source of the shocks, see `generate_normals`.
+            Defaults to `"pseudo"`.
 
     Returns:
-        List[Path]: A list of paths, where each path is a list of prices
+        List[List[float]]: A list of paths, where each path is a list of prices
         starting with s0 and having `steps + 1` elements.
+
+    Raises:
+        ValueError: If `normals` does not have shape `(num_paths, steps)`.
     """
-    if seed is not None:
-        random.seed(seed)
+    if normals is not None and (
+        len(normals) != num_paths or any(len(row) != steps for row in normals)
+    ):
+        raise ValueError("normals must have shape (num_paths, steps).")
+
+    if normals is None and sampler != "pseudo":
+        normals = generate_normals(steps, num_paths, seed, sampler)
+
+    # A dedicated generator keeps seeded runs reproducible without touching the
+    # global `random` state; unseeded runs keep drawing from the module RNG.
+    gauss = random.Random(seed).gauss if seed is not None else random.gauss
+    exp = math.exp
 
     dt = time_horizon / steps
     sqrt_dt = math.sqrt(dt)
@@ -68,27 +243,28 @@ def generate_paths_gbm(
 
     all_paths = []
 
-    for _ in range(num_paths):
+    for k in range(num_paths):
         path = [s0]
+        append = path.append
         current_price = s0
 
-        for _ in range(steps):
-            # Generate Standard Normal random variable Z
-            z = random.gauss(0.0, 1.0)
-
-            # Calculate next price
-            # S_next = S_prev * exp(drift_term + vol_term * z)
-            growth_factor = math.exp(drift_term + vol_term * z)
-            current_price *= growth_factor
-
-            path.append(current_price)
+        if normals is not None:
+            for z in normals[k]:
+                # S_next = S_prev * exp(drift_term + vol_term * z), z ~ N(0, 1)
+                current_price *= exp(drift_term + vol_term * z)
+                append(current_price)
+        else:
+            # Shocks are drawn as they are consumed, without a per-path buffer
+            for _ in range(steps):
+                current_price *= exp(drift_term + vol_term * gauss(0.0, 1.0))
+                append(current_price)
 
         all_paths.append(path)
 
     return all_paths
 
 
-def monte_carlo_price(paths: List[Path], payoff_fn: PayoffFn, discount_factor: float) -> float:
+def monte_carlo_price(paths: Sequence[Path], payoff_fn: PayoffFn, discount_factor: float) -> float:
     """
     Calculates the Monte Carlo price of a derivative.
 
@@ -96,14 +272,14 @@ def monte_carlo_price(paths: List[Path], payoff_fn: PayoffFn, discount_factor: f
     and discounts it to present value.
 
     Args:
-        paths (List[Path]): List of simulated price paths.
+        paths (Sequence[Path]): Simulated price paths.
         payoff_fn (PayoffFn): A function `f(Path) -> float` defining the instrument payoff.
         discount_factor (float): The discount factor $e^{-rT}$.
 
     Returns:
         float: The estimated Present Value.
     """
-    if not paths:
+    if len(paths) == 0:
         return 0.0
 
     total_payoff = 0.0
@@ -117,13 +293,16 @@ def monte_carlo_price(paths: List[Path], payoff_fn: PayoffFn, discount_factor: f
 
 
 # --- Common Payoff Factories ---
+# Payoffs run once per simulated path: the floor at zero is written as a
+# conditional expression rather than a call to the `max` builtin.
 
 
 def payoff_european_call(strike: float) -> PayoffFn:
     """Returns a payoff function for a European Call: max(S_T - K, 0)."""
 
     def _payoff(path: Path) -> float:
-        return max(path[-1] - strike, 0.0)
+        intrinsic = path[-1] - strike
+        return intrinsic if intrinsic > 0.0 else 0.0
 
     return _payoff
 
@@ -132,7 +311,8 @@ def payoff_european_put(strike: float) -> PayoffFn:
     """Returns a payoff function for a European Put: max(K - S_T, 0)."""
 
     def _payoff(path: Path) -> float:
-        return max(strike - path[-1], 0.0)
+        intrinsic = strike - path[-1]
+        return intrinsic if intrinsic > 0.0 else 0.0
 
     return _payoff
 
@@ -146,7 +326,7 @@ def payoff_asian_arithmetic_call(strike: float) -> PayoffFn:
     def _payoff(path: Path) -> float:
         # Average of the entire path (usually excluding S0, but convention varies)
         # Here we include all points for simplicity.
-        avg_price = sum(path) / len(path)
-        return max(avg_price - strike, 0.0)
+        intrinsic = sum(path) / len(path) - strike
+        return intrinsic if intrinsic > 0.0 else 0.0
 
     return _payoff
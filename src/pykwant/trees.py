@@ -8,20 +8,88 @@ before expiration.
 
 The implementation uses the **Cox-Ross-Rubinstein (CRR)** model.
 It is designed to be memory efficient by storing only the current time-step layer,
-avoiding full matrix allocation.
+avoiding full matrix allocation. Calls on a non-dividend underlying (never exercised
+early when rates are non-negative) are valued with an O(N) closed-form kernel.
 """
 
 import math
+import operator
 from datetime import date
+from functools import lru_cache
+from itertools import accumulate, repeat
 
 from pykwant import dates, instruments, rates
 
 
-def _payoff(option_type: str, spot: float, strike: float) -> float:
-    """Internal helper to calculate intrinsic value."""
-    if option_type == "call":
-        return max(spot - strike, 0.0)
-    return max(strike - spot, 0.0)
+def _payoff_sign(option_type: str) -> float:
+    """Internal helper mapping the option type to +1 (call) or -1 (put)."""
+    return 1.0 if option_type == "call" else -1.0
+
+
+@lru_cache(maxsize=32)
+def _log_binomial_coefficients(steps: int) -> tuple[float, ...]:
+    """Internal helper returning ln C(steps, i) for i in 0..steps, cached per tree size."""
+    lg = math.lgamma
+    log_n_fact = lg(steps + 1)
+    return tuple(log_n_fact - lg(i + 1) - lg(steps - i + 1) for i in range(steps + 1))
+
+
+def _european_kernel(leaf_values: list[float], p: float, discount: float) -> float:
+    r"""
+    Internal kernel valuing leaf payoffs without early exercise in O(N).
+
+    Backward induction without the exercise check reduces to the binomial expectation:
+    $$ V_0 = DF_T \sum_i \binom{N}{i} p^{N-i} (1-p)^i V_{N,i} $$
+    Terms are evaluated in log space so deep trees do not underflow.
+    """
+    steps = len(leaf_values) - 1
+    log_p = math.log(p)
+    log_q = math.log(1.0 - p)
+    exp = math.exp
+
+    expectation = 0.0
+    for i, (log_coeff, value) in enumerate(
+        zip(_log_binomial_coefficients(steps), leaf_values, strict=True)
+    ):
+        if value > 0.0:
+            expectation += value * exp(log_coeff + (steps - i) * log_p + i * log_q)
+    return discount * expectation
+
+
+def _american_kernel(
+    top_price: float,
+    values: list[float],
+    d: float,
+    disc_up: float,
+    disc_down: float,
+    sign: float,
+    strike: float,
+) -> float:
+    """
+    Internal kernel running CRR backward induction with an early-exercise check.
+
+    Works in place on the single `values` list (which it overwrites): at layer j
+    only the first j+1 entries are live. Index i in a layer corresponds to i down
+    moves, so node (j, i) connects to (j+1, i) [UP] and (j+1, i+1) [DOWN]. Node
+    prices are not stored: the top node of each layer is the previous top times d,
+    and moving one node down the layer multiplies the price by d^2.
+    """
+    d_sq = d * d
+    for j in range(len(values) - 1, 0, -1):
+        top_price *= d
+        S_node = top_price
+
+        # American Option Logic: max(Continuation, Intrinsic, 0), written with
+        # comparisons since a `max` builtin call per node dominates the step cost
+        for i in range(j):
+            value = disc_up * values[i] + disc_down * values[i + 1]
+            intrinsic = sign * (S_node - strike)
+            S_node *= d_sq
+            if intrinsic > value:
+                value = intrinsic
+            values[i] = value if value > 0.0 else 0.0
+
+    return values[0]
 
 
 def binomial_price(
@@ -55,10 +123,14 @@ def binomial_price(
     if valuation_date > option.expiry_date:
         return 0.0
 
+    # Resolve call/put and strike once: intrinsic = max(sign * (S - K), 0)
+    sign = _payoff_sign(option.call_put)
+    strike = float(option.strike)
+
     # 1. Setup Parameters
     T = dates.act_365(valuation_date, option.expiry_date)
     if T <= 0:
-        return _payoff(option.call_put, spot, float(option.strike))
+        return max(sign * (spot - strike), 0.0)
 
     dt = T / steps
 
@@ -80,42 +152,18 @@ def binomial_price(
     # 2. Generate Leaf Nodes (Payoffs at Maturity)
     # At step N, there are N+1 nodes.
     # Prices: S * u^(N-i) * d^i  for i in 0..N
-    # We store values in a list.
-
-    values = []
-    strike = float(option.strike)
-
-    for i in range(steps + 1):
-        # Number of down moves = i
-        # Number of up moves = steps - i
-        S_T = spot * (u ** (steps - i)) * (d**i)
-        values.append(_payoff(option.call_put, S_T, strike))
-
-    # 3. Backward Induction
-    # Reduce the list by 1 element at each step
-    for step_index in range(steps - 1, -1, -1):
-        new_values = []
-        for i in range(step_index + 1):
-            # Underlying price at this node (step_index, i)
-            # Up moves = step_index - i, Down moves = i
-            S_node = spot * (u ** (step_index - i)) * (d**i)
-
-            # Continuation Value (Discounted expected future value)
-            # values[i] is the "Up" child (from previous loop perspective of i)
-            # values[i+1] is the "Down" child
-            # Wait, loops:
-            # Previous layer (step N): [u^N, u^N-1*d, ..., d^N]
-            # Index i in step N corresponds to i down moves.
-            # Node (N-1, i) connects to (N, i) [UP] and (N, i+1) [DOWN]
-
-            continuation = discount_factor_step * (p * values[i] + (1 - p) * values[i + 1])
-
-            # Intrinsic Value (Early Exercise)
-            intrinsic = _payoff(option.call_put, S_node, strike)
-
-            # American Option Logic
-            new_values.append(max(continuation, intrinsic))
-
-        values = new_values
-
-    return values[0]
+    # Since u * d = 1, adjacent nodes differ by a factor d/u = d^2, so prices
+    # are a running product from the top node instead of using pow().
+    prices = list(accumulate(repeat(d * d, steps), operator.mul, initial=spot * u**steps))
+    values = [max(sign * (S_T - strike), 0.0) for S_T in prices]
+
+    # 3. Valuation
+    # Without dividends and with non-negative rates, early exercise of a call is
+    # never optimal, so the tree value equals its European expectation.
+    if sign > 0 and r >= 0 and 0.0 < p < 1.0:
+        return _european_kernel(values, p, discount_factor_step**steps)
+
+    # Fold the per-step discount into the branch probabilities
+    disc_up = discount_factor_step * p
+    disc_down = discount_factor_step * (1 - p)
+    return _american_kernel(prices[0], values, d, disc_up, disc_down, sign, strike)
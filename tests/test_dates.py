@@ -2,6 +2,7 @@
 Test suite for pykwant.dates module.
 """
 
+import math
 from datetime import date
 
 import pytest
@@ -11,12 +12,13 @@ from pykwant import dates
 # --- Fixtures ---
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def milano_calendar():
     """
     Creates a sample calendar with specific holidays.
     Holidays: Jan 1st (New Year), Jan 6th (Epiphany).
     Weekends: Saturday, Sunday (Default).
+    Calendars are immutable, so one instance is shared by the whole module.
     """
     holidays = frozenset([date(2025, 1, 1), date(2025, 1, 6), date(2026, 1, 1), date(2026, 1, 6)])
     return dates.Calendar(holidays=holidays)
@@ -31,6 +33,16 @@ def test_calendar_creation():
     assert cal.weekends == (6, 7)  # Sat, Sun
 
 
+def test_calendar_is_hashable_and_shares_bitmap():
+    holidays = [date(2025, 1, 1), date(2025, 12, 25)]
+    a = dates.Calendar(holidays=frozenset(holidays))
+    b = dates.Calendar(holidays=set(holidays))  # type: ignore[arg-type]
+    assert a == b and hash(a) == hash(b)
+    assert isinstance(b.holidays, frozenset)
+    # Equal calendars reuse the cached bitmap
+    assert a._bitmap is b._bitmap
+
+
 def test_is_business_day(milano_calendar):
     # Wednesday Jan 1, 2025 -> Holiday
     assert not dates.is_business_day(date(2025, 1, 1), milano_calendar)
@@ -45,6 +57,32 @@ def test_is_business_day(milano_calendar):
     assert dates.is_business_day(date(2025, 1, 7), milano_calendar)
 
 
+def test_is_business_day_outside_holiday_range(milano_calendar):
+    # Beyond the holiday years only weekends apply
+    assert dates.is_business_day(date(2030, 1, 1), milano_calendar)
+    assert not dates.is_business_day(date(2030, 1, 5), milano_calendar)
+    assert not dates.is_business_day(date(1999, 1, 2), milano_calendar)
+    assert dates.is_business_day(date(2025, 1, 1), dates.Calendar())
+
+
+def test_business_days_between(milano_calendar):
+    # January 2025: 23 weekdays minus Jan 1st and Jan 6th
+    assert dates.business_days_between(date(2025, 1, 1), date(2025, 2, 1), milano_calendar) == 21
+    assert dates.business_days_between(date(2025, 2, 1), date(2025, 1, 1), milano_calendar) == -21
+    assert dates.business_days_between(date(2025, 1, 7), date(2025, 1, 7), milano_calendar) == 0
+
+
+def test_business_days_between_matches_day_by_day(milano_calendar):
+    # Spans crossing both ends of the bitmap range
+    start = date(2024, 11, 3)
+    for end in [date(2024, 12, 30), date(2025, 1, 9), date(2026, 1, 7), date(2027, 2, 14)]:
+        expected = sum(
+            dates.is_business_day(date.fromordinal(o), milano_calendar)
+            for o in range(start.toordinal(), end.toordinal())
+        )
+        assert dates.business_days_between(start, end, milano_calendar) == expected
+
+
 # --- Rolling Conventions Tests ---
 
 
@@ -85,6 +123,34 @@ def test_modified_following(milano_calendar):
     assert dates.modified_following(d_end_month, milano_calendar) == date(2025, 5, 30)
 
 
+def test_rolling_across_holiday_cluster_and_range_edges():
+    holidays = frozenset(
+        [date(2025, 1, 1), date(2025, 12, 24), date(2025, 12, 25), date(2025, 12, 26)]
+        + [date(2027, 12, 31)]
+    )
+    cal = dates.Calendar(holidays=holidays)
+    assert dates.following(date(2025, 12, 24), cal) == date(2025, 12, 29)
+    assert dates.preceding(date(2025, 12, 26), cal) == date(2025, 12, 23)
+    # Nearest business day lies outside the precomputed range
+    assert dates.preceding(date(2025, 1, 1), cal) == date(2024, 12, 31)
+    assert dates.following(date(2027, 12, 31), cal) == date(2028, 1, 3)
+    # Fully outside the range
+    assert dates.following(date(2030, 1, 5), cal) == date(2030, 1, 7)
+
+
+def test_holiday_free_calendar_rolling_and_counting():
+    cal = dates.Calendar()
+    # Saturday Jan 4, 2025
+    assert dates.following(date(2025, 1, 4), cal) == date(2025, 1, 6)
+    assert dates.preceding(date(2025, 1, 4), cal) == date(2025, 1, 3)
+    assert dates.business_days_between(date(2025, 1, 1), date(2025, 2, 1), cal) == 23
+
+    # Friday/Saturday weekend
+    gulf = dates.Calendar(weekends=(dates.Weekday.FRIDAY, dates.Weekday.SATURDAY))
+    assert dates.following(date(2025, 1, 3), gulf) == date(2025, 1, 5)
+    assert dates.preceding(date(2025, 1, 4), gulf) == date(2025, 1, 2)
+
+
 # --- Day Count Conventions Tests ---
 
 
@@ -123,6 +189,22 @@ def test_thirty_360():
     assert t_30 == t_31
 
 
+def test_act_act_isda():
+    # Same (leap) year
+    assert dates.act_act_isda(date(2024, 1, 1), date(2024, 7, 1)) == 182.0 / 366.0
+    # Across years: 31 days in 2024 (leap) + 1 day in 2025
+    t = dates.act_act_isda(date(2024, 12, 1), date(2025, 1, 2))
+    assert math.isclose(t, 31.0 / 366.0 + 1.0 / 365.0)
+    # Whole years count as exactly one
+    assert dates.act_act_isda(date(2023, 1, 1), date(2026, 1, 1)) == 3.0
+
+
+def test_business_252(milano_calendar):
+    # January 2025 has 21 business days on the Milano calendar
+    t = dates.business_252(date(2025, 1, 1), date(2025, 2, 1), milano_calendar)
+    assert t == 21.0 / 252.0
+
+
 # --- Schedule Generation Tests ---
 
 
@@ -165,3 +247,12 @@ def test_schedule_short_stub(milano_calendar):
 
     # Expected: Apr 1, May 1
     assert schedule == [date(2025, 4, 1), date(2025, 5, 1)]
+
+
+def test_schedule_clips_to_month_end():
+    # Month-end start: days missing from the target month clip to its last day,
+    # including February 29th in leap years. No calendar adjustment needed here.
+    schedule = dates.generate_schedule(
+        date(2023, 8, 31), date(2024, 8, 31), 3, dates.Calendar(weekends=())
+    )
+    assert schedule == [date(2023, 11, 30), date(2024, 2, 29), date(2024, 5, 31), date(2024, 8, 31)]
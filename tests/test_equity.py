@@ -142,6 +142,18 @@ def test_zero_volatility_call(sample_call, flat_curve_5pct):
     assert math.isclose(price, expected, rel_tol=1e-5)
 
 
+def test_zero_volatility_put(sample_put, flat_curve_5pct):
+    # Same discounted forward intrinsic as the call, with the sign flipped
+    val_date = date(2025, 1, 1)
+    df = flat_curve_5pct(sample_put.expiry_date)
+
+    itm = equity.black_scholes_price(sample_put, 90.0, 0.0, flat_curve_5pct, val_date)
+    assert math.isclose(itm, 100.0 * df - 90.0)
+
+    otm = equity.black_scholes_price(sample_put, 100.0, 0.0, flat_curve_5pct, val_date)
+    assert otm == 0.0
+
+
 def test_at_expiry_ITM(sample_call, flat_curve_5pct):
     # Valuation exactly at expiry
     val_date = sample_call.expiry_date
@@ -161,3 +173,19 @@ def test_at_expiry_OTM(sample_call, flat_curve_5pct):
     price = equity.black_scholes_price(sample_call, spot, 0.20, flat_curve_5pct, val_date)
 
     assert price == 0.0
+
+
+def test_black_scholes_prices_batch(sample_call, sample_put, flat_curve_5pct):
+    val_date = date(2025, 1, 1)
+    spots = [80.0, 100.0, 125.0]
+    for option in (sample_call, sample_put):
+        batch = equity.black_scholes_prices(option, spots, 0.20, flat_curve_5pct, val_date)
+        single = [
+            equity.black_scholes_price(option, s, 0.20, flat_curve_5pct, val_date) for s in spots
+        ]
+        assert batch == single
+
+    # Expired option -> all zeros
+    assert equity.black_scholes_prices(
+        sample_call, spots, 0.20, flat_curve_5pct, date(2026, 6, 1)
+    ) == [0.0, 0.0, 0.0]
@@ -2,6 +2,7 @@
 Test suite for pykwant.instruments module.
 """
 
+import dataclasses
 import math
 from datetime import date
 
@@ -12,13 +13,13 @@ from pykwant import dates, instruments
 # --- Fixtures ---
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_calendar():
     """Simple calendar with weekends only."""
     return dates.Calendar(holidays=frozenset(), weekends=(6, 7))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_bond(sample_calendar):
     """
     Creates a standard 2-Year Bond.
@@ -26,6 +27,7 @@ def sample_bond(sample_calendar):
     Coupon: 5% (Annual)
     Start: 2025-01-01
     Maturity: 2027-01-01
+    Bonds are immutable (and their schedules cached), so one instance is shared.
     """
     return instruments.FixedRateBond(
         face_value=instruments.Money(100.0),
@@ -38,16 +40,31 @@ def sample_bond(sample_calendar):
     )
 
 
-@pytest.fixture
-def flat_curve():
-    """Flat 5% continuously compounded curve."""
+class _BatchCurve:
+    """Curve wrapper exposing the optional batch `discount_factors` method."""
+
+    def __init__(self, curve):
+        self._curve = curve
+        self.batch_calls = 0
+
+    def __call__(self, d: date) -> float:
+        return self._curve(d)
+
+    def discount_factors(self, dates_list):
+        self.batch_calls += 1
+        return [self._curve(d) for d in dates_list]
+
+
+@pytest.fixture(params=["scalar", "batch"])
+def flat_curve(request):
+    """Flat 5% continuously compounded curve, as a plain function or batch-capable."""
     ref_date = date(2025, 1, 1)
 
     def _curve(d: date) -> float:
         t = dates.act_365(ref_date, d)
         return math.exp(-0.05 * t)
 
-    return _curve
+    return _curve if request.param == "scalar" else _BatchCurve(_curve)
 
 
 # --- 1. Data Structure Tests ---
@@ -92,6 +109,18 @@ def test_generate_cash_flows(sample_bond):
     assert principal.amount == 100.0
 
 
+def test_cash_flow_schedule_columns(sample_bond):
+    schedule = instruments.cash_flow_schedule(sample_bond)
+
+    assert len(schedule) == 3
+    assert schedule.payment_dates == (date(2026, 1, 1), date(2027, 1, 1), date(2027, 1, 1))
+    assert schedule.types == ("coupon", "coupon", "principal")
+    assert math.isclose(schedule.amounts[1], 5.0)
+
+    # Row view matches the list API
+    assert list(schedule) == instruments.generate_cash_flows(sample_bond)
+
+
 # --- 3. Accrued Interest Tests ---
 
 
@@ -121,6 +150,16 @@ def test_accrued_interest_after_coupon(sample_bond):
     assert math.isclose(accrued, expected)
 
 
+def test_accrued_interest_on_coupon_date_and_cached_schedule(sample_bond):
+    # On a coupon date a new period starts: nothing accrued
+    assert instruments.accrued_interest(sample_bond, date(2026, 1, 1)) == 0.0
+
+    # Equal (hashable) bonds share one cached schedule
+    twin = dataclasses.replace(sample_bond)
+    assert twin is not sample_bond
+    assert instruments.cash_flow_schedule(twin) is instruments.cash_flow_schedule(sample_bond)
+
+
 # --- 4. Pricing Tests (Bonds) ---
 
 
@@ -146,6 +185,17 @@ def test_price_instrument_bond(sample_bond, flat_curve):
     assert math.isclose(price, expected, rel_tol=1e-9)
 
 
+def test_price_instrument_uses_batch_curve(sample_bond, flat_curve):
+    # Mid-life: only the flows after the valuation date are discounted
+    val_date = date(2026, 1, 1)
+    price = instruments.price_instrument(sample_bond, flat_curve, val_date)
+
+    expected = 105.0 * flat_curve(date(2027, 1, 1))
+    assert math.isclose(price, expected, rel_tol=1e-12)
+    if isinstance(flat_curve, _BatchCurve):
+        assert flat_curve.batch_calls == 1
+
+
 def test_clean_price(sample_bond, flat_curve):
     val_date = date(2025, 4, 1)
 
@@ -3,6 +3,7 @@ Test suite for pykwant.market_risk module.
 """
 
 import math
+from array import array
 
 import pytest
 
@@ -109,3 +110,28 @@ def test_historical_es_basic(sample_returns):
 
     var = market_risk.historical_var(val, sample_returns, confidence_level=0.95)
     assert es >= var
+
+
+def test_historical_presorted_array_returns(sample_returns):
+    # Sort once into a compact array and reuse it for both VaR and ES
+    val = 100_000
+    ordered = array("d", sorted(sample_returns))
+
+    var = market_risk.historical_var(val, ordered, 0.95, sorted_returns=True)
+    es = market_risk.historical_expected_shortfall(val, ordered, 0.95, sorted_returns=True)
+
+    assert var == market_risk.historical_var(val, sample_returns, 0.95)
+    expected_es = market_risk.historical_expected_shortfall(val, sample_returns, 0.95)
+    assert math.isclose(es, expected_es, rel_tol=1e-12)
+
+
+def test_parametric_specialized_functions():
+    for c in (0.95, 0.99):
+        var_fn = market_risk.parametric_var_fn(c, horizon_days=10)
+        es_fn = market_risk.parametric_expected_shortfall_fn(c, horizon_days=10)
+        for value, vol in [(1_000_000, 0.20), (250.0, 0.35)]:
+            assert var_fn(value, vol) == market_risk.parametric_var(value, vol, c, 10)
+            assert es_fn(value, vol) == market_risk.parametric_expected_shortfall(value, vol, c, 10)
+
+    with pytest.raises(ValueError):
+        market_risk.parametric_var_fn(1.5)
@@ -32,6 +32,13 @@ def test_norm_cdf_standard_sigmas():
     assert math.isclose(math_utils.norm_cdf(2.0), 0.9772498, rel_tol=1e-5)
 
 
+def test_norm_cdf_limits():
+    # Deep left tail keeps relative precision (1 + erf would round to 0.0)
+    assert math.isclose(math_utils.norm_cdf(-10.0), 7.619853024160527e-24, rel_tol=1e-12)
+    assert math_utils.norm_cdf(10.0) == 1.0
+    assert math_utils.norm_cdf(-40.0) == 0.0
+
+
 def test_norm_ppf_basics():
     # PPF(0.5) = 0.0 (Mean)
     assert math.isclose(math_utils.norm_ppf(0.5), 0.0, abs_tol=1e-9)
@@ -44,11 +51,16 @@ def test_norm_ppf_basics():
 
 
 def test_norm_ppf_inversion():
-    # CDF(PPF(p)) == p
-    for p in [0.01, 0.25, 0.75, 0.99]:
-        z = math_utils.norm_ppf(p)
-        cdf_val = math_utils.norm_cdf(z)
-        assert math.isclose(cdf_val, p, rel_tol=1e-5)
+    # CDF(PPF(p)) == p, round-tripped through the batch API
+    ps = [0.01, 0.25, 0.75, 0.99]
+    cdf_vals = math_utils.norm_cdfs(math_utils.norm_ppfs(ps))
+    assert all(math.isclose(c, p, rel_tol=1e-5) for c, p in zip(cdf_vals, ps, strict=True))
+
+
+def test_norm_ppf_far_tail():
+    # Reference quantiles of the standard normal
+    assert math.isclose(math_utils.norm_ppf(1e-10), -6.361340902404056, rel_tol=1e-12)
+    assert math.isclose(math_utils.norm_ppf(1.0 - 1e-6), 4.753424308822899, rel_tol=1e-9)
 
 
 def test_norm_ppf_errors():
@@ -58,6 +70,18 @@ def test_norm_ppf_errors():
         math_utils.norm_ppf(1.0)  # Invalid
 
 
+def test_batch_gaussian_functions_match_scalar():
+    xs = [-3.0, -0.5, 0.0, 1.25, 4.0]
+    assert math_utils.norm_cdfs(xs) == [math_utils.norm_cdf(x) for x in xs]
+
+    ps = [0.001, 0.1, 0.5, 0.9, 0.999]
+    assert math_utils.norm_ppfs(ps) == [math_utils.norm_ppf(p) for p in ps]
+    assert math_utils.norm_ppfs([]) == []
+
+    with pytest.raises(ValueError):
+        math_utils.norm_ppfs([0.5, 1.0])
+
+
 # --- 2. Descriptive Statistics Tests ---
 
 
@@ -155,3 +179,25 @@ def test_percentile_unsorted():
     # Should sort internally to [10, 20]
     assert math_utils.percentile(data, 0.0) == 10.0
     assert math_utils.percentile(data, 1.0) == 20.0
+
+
+def test_percentile_overwrite_input():
+    data = [((i * 7919) % 1000) / 10.0 for i in range(1000)]
+    for p in [0.0, 0.25, 0.5, 0.9, 1.0]:
+        expected = math_utils.percentile(data, p)
+        buffer = list(data)
+        assert math_utils.percentile(buffer, p, overwrite_input=True) == expected
+
+    # Central ranks sort the caller's buffer in place instead of copying it
+    buffer = list(data)
+    math_utils.percentile(buffer, 0.5, overwrite_input=True)
+    assert buffer == sorted(data)
+
+
+def test_percentile_tails_match_full_sort():
+    # Extreme percentiles use partial selection instead of a full sort
+    data = [((i * 7919) % 1000) / 10.0 for i in range(1000)]
+    ordered = sorted(data)
+    for p in [0.0, 0.001, 0.0105, 0.5, 0.9895, 0.999, 1.0]:
+        expected = math_utils.percentile(ordered, p, sorted_data=True)
+        assert math_utils.percentile(data, p) == expected
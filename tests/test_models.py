@@ -6,7 +6,7 @@ import math
 
 import pytest
 
-from pykwant import models
+from pykwant import math_utils, models
 
 # --- Fixtures ---
 
@@ -50,6 +50,18 @@ def test_zcb_price_maturity(hw_model, flat_curve_wrapper):
     assert price == 1.0
 
 
+def test_zcb_price_from_market_matches_curve(hw_model, flat_curve_wrapper):
+    # Market inputs read off the curve once reproduce the curve-based price
+    t, T = 1.0, 5.0
+    f_0_t = 0.05  # Flat continuously compounded curve
+    P_0_t, P_0_T = flat_curve_wrapper(t), flat_curve_wrapper(T)
+
+    for r_t in [0.01, 0.05, 0.09]:
+        expected = models.zcb_price(hw_model, flat_curve_wrapper, r_t, t, T)
+        price = models.zcb_price_from_market(hw_model, P_0_t, P_0_T, f_0_t, r_t, t, T)
+        assert math.isclose(price, expected, rel_tol=1e-9)
+
+
 # --- Simulation Tests ---
 
 
@@ -66,7 +78,7 @@ def test_short_rate_mean(hw_model, flat_curve_wrapper):
 
     # Check mean at terminal step (t=1.0)
     final_rates = [p[-1] for p in paths]
-    mean_r = sum(final_rates) / len(final_rates)
+    mean_r = math_utils.mean(final_rates)
 
     # Analytical Expectation for HW:
     # E[r(t)] = f(0, t) + (sigma^2 / 2a^2) * (1 - exp(-at))^2
@@ -91,8 +103,7 @@ def test_short_rate_volatility(hw_model, flat_curve_wrapper):
     final_rates = [p[-1] for p in paths]
 
     # Calculate sample variance
-    mean_val = sum(final_rates) / len(final_rates)
-    var_sample = sum((r - mean_val) ** 2 for r in final_rates) / (len(final_rates) - 1)
+    var_sample = math_utils.variance(final_rates, is_sample=True)
 
     # Analytical variance
     a = hw_model.mean_reversion
@@ -44,6 +44,19 @@ def test_linear_interpolation_no_extrapolation():
     assert math.isnan(interp(11.0))
 
 
+def test_linear_interpolation_many_pillars():
+    # y = x^2 sampled on 0..19: each query must land in its own segment
+    x_data = [float(i) for i in range(20)]
+    y_data = [x * x for x in x_data]
+
+    interp = numerics.linear_interpolation(x_data, y_data)
+
+    for i in range(19):
+        # Midpoint chord of x^2 between i and i+1
+        assert math.isclose(interp(i + 0.5), i * i + i + 0.5)
+    assert interp(7.0) == 49.0
+
+
 def test_linear_interpolation_errors():
     with pytest.raises(ValueError):
         numerics.linear_interpolation([1.0], [1.0, 2.0])
@@ -86,7 +99,7 @@ def test_log_linear_returns_nan_no_extrap():
 def test_numerical_derivative_quadratic():
     # f(x) = x^2  => f'(x) = 2x
     def func(x):
-        return x**2
+        return x * x
 
     deriv = numerics.numerical_derivative(func, h=1e-5)
 
@@ -100,7 +113,7 @@ def test_numerical_derivative_quadratic():
 def test_numerical_derivative_cubic():
     # f(x) = x^3 => f'(x) = 3x^2
     def func(x):
-        return x**3
+        return x * x * x
 
     deriv = numerics.numerical_derivative(func)
 
@@ -115,7 +128,7 @@ def test_newton_solve_basic():
     # Solve x^2 = 4
     # Roots: 2.0, -2.0
     def f(x):
-        return x**2
+        return x * x
 
     # Guess near positive root
     root_pos = numerics.newton_solve(f, target=4.0, guess=1.0)
@@ -147,7 +160,7 @@ def test_newton_solve_zero_gradient():
     # f(x) = x^2, target=-1 (impossible)
     # Derivative is 2x. If guess is 0, deriv is 0 -> fail.
     def f(x):
-        return x**2
+        return x * x
 
     root = numerics.newton_solve(f, target=-1.0, guess=0.0)
     assert root is None
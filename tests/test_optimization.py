@@ -3,6 +3,7 @@ Test suite for pykwant.optimization module.
 """
 
 import math
+import random
 
 import pytest
 
@@ -45,6 +46,9 @@ def test_generate_random_weights():
     assert math.isclose(sum(weights), 1.0)
     assert all(0 <= w <= 1 for w in weights)
 
+    # A single asset takes the whole allocation
+    assert optimization.generate_random_weights(1) == [1.0]
+
 
 def test_portfolio_return(asset_returns):
     # 50/50 weights
@@ -72,6 +76,15 @@ def test_portfolio_variance_correlated(cov_matrix_correlated):
     assert math.isclose(var, 0.01)
 
 
+def test_portfolio_variance_matches_double_sum():
+    # The folded quadratic form must hold for any matrix, symmetric or not
+    weights = [0.2, 0.3, 0.5]
+    matrix = [[0.04, 0.01, 0.002], [0.012, 0.09, -0.005], [0.0, -0.003, 0.0625]]
+    expected = sum(weights[i] * weights[j] * matrix[i][j] for i in range(3) for j in range(3))
+    calc = optimization._portfolio_variance(weights, matrix)
+    assert math.isclose(calc, expected, rel_tol=1e-12)
+
+
 # --- Integration Tests (Monte Carlo Optimizer) ---
 
 
@@ -101,6 +114,23 @@ def test_optimizer_basic(asset_returns, cov_matrix_uncorrelated):
     assert max_sharpe.volatility > 0
 
 
+def test_optimizer_seed_is_local(asset_returns, cov_matrix_uncorrelated):
+    random.seed(7)
+    expected_next = random.random()
+
+    random.seed(7)
+    first = optimization.optimize_portfolio_monte_carlo(
+        asset_returns, cov_matrix_uncorrelated, num_portfolios=200, seed=42
+    )
+    # The global generator is left untouched by a seeded run
+    assert random.random() == expected_next
+
+    second = optimization.optimize_portfolio_monte_carlo(
+        asset_returns, cov_matrix_uncorrelated, num_portfolios=200, seed=42
+    )
+    assert first == second
+
+
 def test_optimizer_input_validation():
     with pytest.raises(ValueError):
         # Mismatch in dimensions
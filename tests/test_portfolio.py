@@ -146,3 +146,49 @@ def test_empty_portfolio(flat_curve_5pct):
 
     exposure = portfolio.exposure_by_maturity_year(empty_port, flat_curve_5pct, val_date)
     assert exposure == {}
+
+
+def test_duplicate_instruments_priced_once(sample_portfolio, flat_curve_5pct, monkeypatch):
+    val_date = date(2025, 1, 1)
+    calls = []
+    original = instruments.price_instrument
+
+    def _counting_price(instrument, curve, valuation_date):
+        calls.append(instrument)
+        return original(instrument, curve, valuation_date)
+
+    monkeypatch.setattr(instruments, "price_instrument", _counting_price)
+
+    # Three positions over two distinct bonds
+    portfolio.portfolio_npv(sample_portfolio, flat_curve_5pct, val_date)
+    assert len(calls) == 2
+
+    calls.clear()
+    portfolio.exposure_by_maturity_year(sample_portfolio, flat_curve_5pct, val_date)
+    assert len(calls) == 2
+
+
+def test_batch_curve_reached_through_memoization(sample_portfolio, flat_curve_5pct):
+    val_date = date(2025, 1, 1)
+
+    class _CountingBatchCurve:
+        def __init__(self) -> None:
+            self.scalar_calls = 0
+            self.batched_dates: list[date] = []
+
+        def __call__(self, d: date) -> float:
+            self.scalar_calls += 1
+            return flat_curve_5pct(d)
+
+        def discount_factors(self, dates_list):
+            self.batched_dates.extend(dates_list)
+            return [flat_curve_5pct(d) for d in dates_list]
+
+    curve = _CountingBatchCurve()
+    npv = portfolio.portfolio_npv(sample_portfolio, curve, val_date)
+
+    assert npv == portfolio.portfolio_npv(sample_portfolio, flat_curve_5pct, val_date)
+    # Bonds are discounted through the batch method, each date requested once
+    assert curve.scalar_calls == 0
+    assert curve.batched_dates
+    assert len(curve.batched_dates) == len(set(curve.batched_dates))
@@ -80,6 +80,20 @@ def test_curve_interpolation(sample_curve):
     assert math.isclose(sample_curve(d_mid), expected_df, rel_tol=1e-3)
 
 
+def test_act_365_curve_matches_generic_day_count():
+    ref_date = date(2025, 1, 1)
+    dates_list = [date(2026, 1, 1), date(2027, 1, 1), date(2030, 1, 1)]
+    dfs = [0.95, 0.90, 0.78]
+
+    fast = rates.create_curve_from_discount_factor(ref_date, dates_list, dfs)
+    generic = rates.create_curve_from_discount_factor(
+        ref_date, dates_list, dfs, day_count=lambda s, e: dates.act_365(s, e)
+    )
+
+    queries = [date(2025, 3, 1), date(2026, 7, 2), date(2029, 2, 28), date(2031, 6, 30)]
+    assert [fast(d) for d in queries] == [generic(d) for d in queries]
+
+
 # --- 3. Rate Helpers Tests ---
 
 
@@ -123,3 +137,18 @@ def test_present_value(sample_curve):
 
     pv = rates.present_value(amount, pay_date, sample_curve)
     assert math.isclose(pv, 95.0)
+
+
+def test_memoized_curve(sample_curve):
+    calls = []
+
+    def _counting_curve(d: date) -> float:
+        calls.append(d)
+        return sample_curve(d)
+
+    cached = rates.memoized_curve(_counting_curve)
+    d = date(2026, 7, 1)
+
+    assert cached(d) == sample_curve(d)
+    assert cached(d) == sample_curve(d)
+    assert calls == [d]
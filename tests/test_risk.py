@@ -129,6 +129,25 @@ def test_calculate_risk_metrics_integration(par_bond, flat_curve_5pct):
     assert math.isclose(metrics["dv01"], predicted_dv01, rel_tol=1e-2)
 
 
+def test_risk_metrics_share_one_set_of_shifts(par_bond, flat_curve_5pct):
+    val_date = date(2025, 1, 1)
+    calls: list[date] = []
+
+    def counting_curve(d: date) -> float:
+        calls.append(d)
+        return flat_curve_5pct(d)
+
+    metrics = risk.calculate_risk_metrics(par_bond, counting_curve, val_date)
+
+    # Every bumped repricing reuses a single lookup per date on the base curve
+    assert len(calls) == len(set(calls))
+
+    # The shared report agrees exactly with the standalone metrics
+    assert metrics["duration"] == risk.effective_duration(par_bond, flat_curve_5pct, val_date)
+    assert metrics["convexity"] == risk.effective_convexity(par_bond, flat_curve_5pct, val_date)
+    assert metrics["dv01"] == risk.pv01(par_bond, flat_curve_5pct, val_date)
+
+
 def test_zero_price_instrument(flat_curve_5pct, sample_calendar):
     # Instrument that hasn't started yet or has 0 flows left
     # (Here we hack it by valuing past maturity)
@@ -150,3 +169,25 @@ def test_zero_price_instrument(flat_curve_5pct, sample_calendar):
 
     conv = risk.effective_convexity(bond, flat_curve_5pct, val_date)
     assert conv == 0.0
+
+
+def test_shift_curve_memoizes_dates(flat_curve_5pct):
+    ref_date = date(2025, 1, 1)
+    calls: list[date] = []
+
+    def counting_curve(d: date) -> float:
+        calls.append(d)
+        return flat_curve_5pct(d)
+
+    shifted = risk._shift_curve(counting_curve, 1e-4, ref_date)
+    target = date(2027, 1, 1)
+
+    first = shifted(target)
+    second = shifted(target)
+
+    assert first == second
+    assert calls == [target]
+
+    # Shift is applied as an additive continuous rate
+    t = dates.act_365(ref_date, target)
+    assert math.isclose(first, math.exp(-(0.05 + 1e-4) * t), rel_tol=1e-12)
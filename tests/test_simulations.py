@@ -3,11 +3,13 @@ Test suite for pykwant.simulations module.
 """
 
 import math
+import random
+from array import array
 from datetime import date
 
 import pytest
 
-from pykwant import dates, equity, instruments, simulations
+from pykwant import dates, equity, instruments, math_utils, simulations
 
 # --- Fixtures ---
 
@@ -51,6 +53,109 @@ def test_gbm_martingale_property():
     assert math.isclose(mean_st, expected_st, rel_tol=0.01)
 
 
+def test_gbm_seed_reproducible_and_isolated():
+    """
+    Seeded runs are reproducible and do not consume the global random state.
+    """
+    random.seed(7)
+    expected_next = random.random()
+
+    random.seed(7)
+    paths_a = simulations.generate_paths_gbm(100.0, 0.05, 0.2, 1.0, 5, 10, seed=1)
+    paths_b = simulations.generate_paths_gbm(100.0, 0.05, 0.2, 1.0, 5, 10, seed=1)
+
+    assert paths_a == paths_b
+    assert random.random() == expected_next
+
+
+def test_gbm_prebuilt_normals_match_seed():
+    normals = simulations.generate_normals(steps=5, num_paths=20, seed=3)
+
+    from_normals = simulations.generate_paths_gbm(100.0, 0.05, 0.2, 1.0, 5, 20, normals=normals)
+    from_seed = simulations.generate_paths_gbm(100.0, 0.05, 0.2, 1.0, 5, 20, seed=3)
+
+    assert from_normals == from_seed
+
+
+def test_gbm_common_random_numbers_delta():
+    """
+    Sharing shocks across bumped spots gives a stable finite-difference Delta.
+    Black-Scholes Delta for S=K=100, r=5%, vol=20%, T=1 is N(0.35) ~ 0.6368.
+    """
+    normals = simulations.generate_normals(steps=10, num_paths=500, seed=11)
+    payoff = simulations.payoff_european_call(100.0)
+
+    def price(s0: float) -> float:
+        paths = simulations.generate_paths_gbm(s0, 0.05, 0.2, 1.0, 10, 500, normals=normals)
+        return simulations.monte_carlo_price(paths, payoff, math.exp(-0.05))
+
+    h = 0.01
+    delta = (price(100.0 + h) - price(100.0 - h)) / (2 * h)
+
+    assert math.isclose(delta, 0.6368, abs_tol=0.05)
+
+
+def test_gbm_prebuilt_normals_shape_error():
+    with pytest.raises(ValueError):
+        simulations.generate_paths_gbm(100.0, 0.05, 0.2, 1.0, 5, 2, normals=[[0.0] * 4] * 2)
+
+
+def test_halton_normals_moments():
+    normals = simulations.generate_normals(steps=8, num_paths=1024, seed=5, sampler="halton")
+
+    assert len(normals) == 1024
+    assert all(len(row) == 8 for row in normals)
+
+    flat = [z for row in normals for z in row]
+    mean_z = sum(flat) / len(flat)
+    var_z = sum((z - mean_z) * (z - mean_z) for z in flat) / (len(flat) - 1)
+
+    assert math.isclose(mean_z, 0.0, abs_tol=0.01)
+    assert math.isclose(var_z, 1.0, rel_tol=0.02)
+
+    # Scrambling is driven by the seed
+    again = simulations.generate_normals(steps=8, num_paths=1024, seed=5, sampler="halton")
+    assert again == normals
+
+
+def test_antithetic_normals_pairs():
+    normals = simulations.generate_normals(steps=6, num_paths=7, seed=2, sampler="antithetic")
+
+    assert len(normals) == 7
+    for row, mirror in zip(normals[0:6:2], normals[1:7:2], strict=True):
+        assert mirror == [-z for z in row]
+
+    # GBM paths can be built directly from the antithetic sampler
+    paths = simulations.generate_paths_gbm(
+        100.0, 0.05, 0.2, 1.0, 6, 7, seed=2, sampler="antithetic"
+    )
+    assert paths == simulations.generate_paths_gbm(100.0, 0.05, 0.2, 1.0, 6, 7, normals=normals)
+
+
+def test_antithetic_reduces_variance():
+    payoff = simulations.payoff_european_call(100.0)
+
+    def terminal_payoffs(sampler: simulations.Sampler) -> list[float]:
+        paths = simulations.generate_paths_gbm(
+            100.0, 0.05, 0.2, 1.0, 1, 2000, seed=9, sampler=sampler
+        )
+        return [payoff(p) for p in paths]
+
+    plain = terminal_payoffs("pseudo")
+    mirrored = terminal_payoffs("antithetic")
+    # Variance of the estimator: per-path variance vs variance of pair averages
+    pair_means = [(a + b) / 2 for a, b in zip(mirrored[0::2], mirrored[1::2], strict=True)]
+
+    plain_var = math_utils.variance(plain) / len(plain)
+    antithetic_var = math_utils.variance(pair_means) / len(pair_means)
+    assert antithetic_var < 0.7 * plain_var
+
+
+def test_unknown_sampler():
+    with pytest.raises(ValueError):
+        simulations.generate_normals(steps=4, num_paths=4, sampler="sobol")  # type: ignore[arg-type]
+
+
 # --- Pricing Tests ---
 
 
@@ -88,6 +193,33 @@ def test_monte_carlo_european_call_vs_bs(flat_curve_5pct):
     assert math.isclose(mc_price, bs_price, abs_tol=0.25)
 
 
+def test_monte_carlo_halton_converges_faster(flat_curve_5pct):
+    """
+    Quasi-random shocks reach Black-Scholes much tighter than pseudo-random ones
+    for the same number of paths.
+    """
+    val_date = date(2025, 1, 1)
+    expiry = date(2026, 1, 1)
+    opt = instruments.EuropeanOption("TEST", 100.0, expiry, "call")
+    bs_price = equity.black_scholes_price(opt, 100.0, 0.20, flat_curve_5pct, val_date)
+
+    paths = simulations.generate_paths_gbm(
+        s0=100.0,
+        drift=0.05,
+        volatility=0.20,
+        time_horizon=1.0,
+        steps=16,
+        num_paths=1024,
+        seed=1,
+        sampler="halton",
+    )
+    payoff = simulations.payoff_european_call(100.0)
+    mc_price = simulations.monte_carlo_price(paths, payoff, flat_curve_5pct(expiry))
+
+    # Pseudo-random error at this size is ~0.5; Halton stays well inside 0.1
+    assert math.isclose(mc_price, bs_price, abs_tol=0.1)
+
+
 def test_monte_carlo_asian_call():
     """
     Price an Asian Option (Arithmetic Average).
@@ -120,5 +252,25 @@ def test_monte_carlo_asian_call():
     assert price_asian > 0.0
 
 
+def test_payoffs_accept_any_float_sequence():
+    path_list = [100.0, 90.0, 120.0]
+    path_array = array("d", path_list)
+    path_tuple = tuple(path_list)
+
+    for payoff in (
+        simulations.payoff_european_call(100.0),
+        simulations.payoff_european_put(110.0),
+        simulations.payoff_asian_arithmetic_call(100.0),
+    ):
+        expected = payoff(path_list)
+        assert payoff(path_array) == expected
+        assert payoff(path_tuple) == expected
+
+    price = simulations.monte_carlo_price(
+        (path_array, path_tuple), simulations.payoff_european_call(100.0), 1.0
+    )
+    assert price == 20.0
+
+
 def test_empty_paths():
     assert simulations.monte_carlo_price([], lambda p: 0.0, 1.0) == 0.0
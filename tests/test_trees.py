@@ -100,3 +100,36 @@ def test_tree_payoff_at_maturity(american_put, flat_curve_5pct):
     # Spot 90, Strike 100 -> Value 10
     price = trees.binomial_price(american_put, 90.0, 0.20, flat_curve_5pct, val_date)
     assert price == 10.0
+
+
+def test_call_kernel_matches_backward_induction():
+    # Without dividends an American call equals its European tree value, so the
+    # closed-form call kernel must agree with full backward induction.
+    steps = 60
+    spot, strike = 95.0, 100.0
+    u = math.exp(0.25 * math.sqrt(1.0 / steps))
+    d = 1.0 / u
+    disc = math.exp(-0.03 / steps)
+    p = (1.0 / disc - d) / (u - d)
+
+    prices = [spot * u ** (steps - i) * d**i for i in range(steps + 1)]
+    values = [max(s - strike, 0.0) for s in prices]
+
+    closed_form = trees._european_kernel(values, p, disc**steps)
+    induction = trees._american_kernel(prices[0], values, d, disc * p, disc * (1 - p), 1.0, strike)
+
+    assert math.isclose(closed_form, induction, rel_tol=1e-10)
+
+
+def test_american_call_negative_rates():
+    # With negative rates early exercise of a call can pay off: the tree must
+    # never price it below intrinsic value.
+    val_date = date(2025, 1, 1)
+
+    def negative_curve(d: date) -> float:
+        return math.exp(0.05 * dates.act_365(val_date, d))
+
+    deep_itm_call = instruments.AmericanOption("TEST", 100.0, date(2026, 1, 1), "call")
+    price = trees.binomial_price(deep_itm_call, 200.0, 0.01, negative_curve, val_date, steps=50)
+
+    assert math.isclose(price, 100.0, abs_tol=1e-9)